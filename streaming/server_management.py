@@ -5,6 +5,8 @@ Server configuration and management
 
 import json
 import time
+from ipaddress import ip_address
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional, Any
@@ -28,11 +30,8 @@ except ImportError:
             @staticmethod
             def test_connection(host, port, timeout=3):
                 try:
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.settimeout(timeout)
-                    result = sock.connect_ex((host, port))
-                    sock.close()
-                    return result == 0
+                    with socket.create_connection((host, port), timeout):
+                        return True
                 except Exception:
                     return False
         
@@ -45,7 +44,20 @@ except ImportError:
                     return None
 
 
-@dataclass
+# Optional SIMD JSON parser for large server registries
+try:
+    import simdjson
+    _SIMD_PARSER = simdjson.Parser()
+except ImportError:
+    _SIMD_PARSER = None
+
+# Below this size the FFI overhead outweighs simdjson's parsing speedup
+_SIMD_MIN_SIZE = 64 * 1024
+
+_LOCAL_HOSTS = frozenset({'localhost', '127.0.0.1', '::1'})
+
+
+@dataclass(frozen=True)
 class ServerConfig:
     """Server configuration"""
     name: str
@@ -55,49 +67,58 @@ class ServerConfig:
     ssl_enabled: bool = False
     description: str = ""
     
+    _VALIDATIONS = (
+        ('name', lambda v: isinstance(v, str) and v.strip(), "Server name is required"),
+        ('host', lambda v: isinstance(v, str) and v.strip(), "Host is required"),
+        ('port', lambda v: isinstance(v, int) and 1 <= v <= 65535, "Port must be between 1-65535"),
+        ('rtmp_port', lambda v: isinstance(v, int) and 1 <= v <= 65535, "RTMP port must be between 1-65535"),
+    )
+    
+    def __post_init__(self):
+        # Derived values are computed once; the dataclass is frozen so they cannot go stale
+        protocol = "rtmps" if self.ssl_enabled else "rtmp"
+        object.__setattr__(self, '_rtmp_url', f"{protocol}://{self.host}:{self.rtmp_port}/live")
+        
+        # A missing or non-string host is left for validate() to report
+        host_is_str = isinstance(self.host, str)
+        object.__setattr__(self, '_is_local', host_is_str and self.host.lower() in _LOCAL_HOSTS)
+        try:
+            is_local_network = host_is_str and ip_address(self.host).is_private
+        except ValueError:
+            # Hostnames are not classified without a DNS lookup
+            is_local_network = False
+        object.__setattr__(self, '_is_local_network', is_local_network)
+    
     @property
     def rtmp_url(self) -> str:
-        protocol = "rtmps" if self.ssl_enabled else "rtmp"
-        return f"{protocol}://{self.host}:{self.rtmp_port}/live"
+        return self._rtmp_url
     
     @property
     def is_local(self) -> bool:
-        return self.host.lower() in ['localhost', '127.0.0.1']
+        return self._is_local
     
     @property
     def is_local_network(self) -> bool:
-        return self.host.startswith('192.168.') or self.host.startswith('10.')
+        return self._is_local_network
     
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ServerConfig':
-        defaults = {
-            'ssl_enabled': False,
-            'description': ''
-        }
-        config_data = {**defaults, **data}
-        return cls(**{k: v for k, v in config_data.items() if k in 
-                     ['name', 'host', 'port', 'rtmp_port', 'ssl_enabled', 'description']})
+        return cls(
+            name=data['name'],
+            host=data['host'],
+            port=data['port'],
+            rtmp_port=data['rtmp_port'],
+            ssl_enabled=data.get('ssl_enabled', False),
+            description=data.get('description', '')
+        )
     
     def validate(self) -> List[str]:
         """Validate server configuration"""
-        errors = []
-        
-        if not self.name or not self.name.strip():
-            errors.append("Server name is required")
-        
-        if not self.host or not self.host.strip():
-            errors.append("Host is required")
-        
-        if not isinstance(self.port, int) or not (1 <= self.port <= 65535):
-            errors.append("Port must be between 1-65535")
-        
-        if not isinstance(self.rtmp_port, int) or not (1 <= self.rtmp_port <= 65535):
-            errors.append("RTMP port must be between 1-65535")
-        
-        return errors
+        return [message for attr, is_valid, message in self._VALIDATIONS
+                if not is_valid(getattr(self, attr))]
     
     def test_connection(self, timeout: int = 5) -> Dict[str, Any]:
         """Test server connection"""
@@ -129,6 +150,10 @@ class ServerManager:
         """Load servers from configuration"""
         try:
             if self.config_file.exists():
+                if _SIMD_PARSER is not None and self.config_file.stat().st_size > _SIMD_MIN_SIZE:
+                    self._load_servers_simd()
+                    return
+                
                 with open(self.config_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                 
@@ -143,6 +168,19 @@ class ServerManager:
             self.logger.error(f"Failed to load servers: {e}")
             self.create_default_servers()
     
+    def _load_servers_simd(self):
+        """Load a large server registry with simdjson, reading only server entries"""
+        doc = _SIMD_PARSER.parse(self.config_file.read_bytes())
+        servers = doc.get('servers')
+        if servers is None:
+            return
+        
+        for server_id, server_data in servers.items():
+            try:
+                self.servers[server_id] = ServerConfig.from_dict(server_data.as_dict())
+            except Exception as e:
+                self.logger.warning(f"Failed to load server {server_id}: {e}")
+    
     def create_default_servers(self):
         """Create default servers"""
         default_servers = {
@@ -178,3 +216,23 @@ class ServerManager:
     def get_servers(self) -> Dict[str, ServerConfig]:
         """Get all servers"""
         return self.servers.copy()
+    
+    def test_all_connections(self, timeout: int = 3) -> Dict[str, Dict[str, Any]]:
+        """Test all servers concurrently"""
+        results: Dict[str, Dict[str, Any]] = {}
+        if not self.servers:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(self.servers))) as executor:
+            futures = {
+                executor.submit(server.test_connection, timeout): server_id
+                for server_id, server in self.servers.items()
+            }
+            for future in as_completed(futures):
+                server_id = futures[future]
+                try:
+                    results[server_id] = future.result()
+                except Exception as e:
+                    results[server_id] = {'success': False, 'rtmp_reachable': False, 'error': str(e)}
+        
+        return results
@@ -5,13 +5,15 @@ UI utilities and helper functions
 
 # PyQt compatibility
 try:
-    from PyQt6.QtWidgets import *
-    from PyQt6.QtCore import *
-    from PyQt6.QtGui import *
+    from PyQt6.QtWidgets import (
+        QComboBox, QWidget, QGroupBox, QVBoxLayout, QHBoxLayout, QFormLayout,
+        QPushButton, QMessageBox, QInputDialog
+    )
 except ImportError:
-    from PyQt5.QtWidgets import *
-    from PyQt5.QtCore import *
-    from PyQt5.QtGui import *
+    from PyQt5.QtWidgets import (
+        QComboBox, QWidget, QGroupBox, QVBoxLayout, QHBoxLayout, QFormLayout,
+        QPushButton, QMessageBox, QInputDialog
+    )
 
 from typing import Dict, List, Optional, Any, Callable
 
@@ -77,22 +79,19 @@ class UIUpdateManager:
 class FormBuilder:
     """Form building utilities"""
     
+    _LAYOUT_MAP = {
+        'vertical': QVBoxLayout,
+        'horizontal': QHBoxLayout,
+        'form': QFormLayout
+    }
+    
     def __init__(self, parent=None):
         self.parent = parent
     
     def create_group_box(self, title: str, layout_type='vertical') -> QGroupBox:
         """Create group box with layout"""
         group = QGroupBox(title)
-        
-        if layout_type == 'vertical':
-            layout = QVBoxLayout(group)
-        elif layout_type == 'horizontal':
-            layout = QHBoxLayout(group)
-        elif layout_type == 'form':
-            layout = QFormLayout(group)
-        else:
-            layout = QVBoxLayout(group)
-        
+        self._LAYOUT_MAP.get(layout_type, QVBoxLayout)(group)
         return group
     
     def create_button_row(self, buttons: List[Dict[str, Any]]) -> QWidget:
@@ -4,13 +4,21 @@ Core utilities for streaming functionality
 """
 
 import os
+import re
 import json
-import time
 import socket
 import logging
+import secrets
+import threading
+import itertools
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+_TIME_FORMAT_RE = re.compile(r'^\d{1,2}:\d{2}:\d{2}$')
+
+# Per-process sequence that keeps generated stream keys unique
+_stream_counter = itertools.count()
+
 
 class MediaValidator:
     """Media file validation utility"""
@@ -45,39 +53,46 @@ class MediaValidator:
     def get_media_file_info(cls, file_path: str) -> dict:
         """Get media file information"""
         try:
-            if not cls.is_valid_media_file(file_path):
-                return {'valid': False, 'error': 'Invalid media file'}
-            
-            file_info = Path(file_path).stat()
-            return {
-                'valid': True,
-                'name': Path(file_path).name,
-                'size': file_info.st_size,
-                'size_mb': round(file_info.st_size / (1024 * 1024), 2),
-                'path': str(file_path)
-            }
-        except Exception as e:
+            file_info = os.stat(file_path)
+        except (OSError, TypeError, ValueError) as e:
             return {'valid': False, 'error': str(e)}
+        
+        file_ext = os.path.splitext(file_path)[1].lower()
+        if file_ext not in cls.MEDIA_EXTENSIONS or file_info.st_size <= 1024:
+            return {'valid': False, 'error': 'Invalid media file'}
+        
+        return {
+            'valid': True,
+            'name': os.path.basename(file_path),
+            'size': file_info.st_size,
+            'size_mb': round(file_info.st_size / (1024 * 1024), 2),
+            'path': str(file_path)
+        }
 
 
 class LoggerManager:
     """Logger management utility"""
     
     _loggers = {}
+    _lock = threading.Lock()
     
     @classmethod
     def get_logger(cls, name: str):
         """Get or create logger"""
-        if name not in cls._loggers:
-            logger = logging.getLogger(name)
+        cached = cls._loggers.get(name)
+        if cached is not None:
+            return cached
+        
+        logger = logging.getLogger(name)
+        with cls._lock:
             if not logger.handlers:
                 handler = logging.StreamHandler()
                 formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s')
                 handler.setFormatter(formatter)
                 logger.addHandler(handler)
                 logger.setLevel(logging.INFO)
-            cls._loggers[name] = logger
-        return cls._loggers[name]
+        cls._loggers[name] = logger
+        return logger
 
 
 class StreamingUtils:
@@ -86,18 +101,13 @@ class StreamingUtils:
     @staticmethod
     def generate_stream_key(prefix: str = "stream") -> str:
         """Generate unique stream key"""
-        import random
-        timestamp = int(time.time())
-        random_part = random.randint(1000, 9999)
-        return f"{prefix}_{timestamp}_{random_part}"
+        return f"{prefix}_{next(_stream_counter)}_{secrets.token_urlsafe(6)}"
     
     @staticmethod
     def validate_time_format(time_str: str) -> bool:
         """Validate HH:MM:SS time format"""
         try:
-            import re
-            pattern = r'^\d{1,2}:\d{2}:\d{2}$'
-            return bool(re.match(pattern, time_str))
+            return bool(_TIME_FORMAT_RE.match(time_str))
         except Exception:
             return False
     
@@ -121,11 +131,8 @@ class NetworkUtils:
     def test_connection(host: str, port: int, timeout: int = 3) -> bool:
         """Test network connection"""
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            result = sock.connect_ex((host, port))
-            sock.close()
-            return result == 0
+            with socket.create_connection((host, port), timeout):
+                return True
         except Exception:
             return False
     
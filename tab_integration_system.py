@@ -17,7 +17,11 @@ from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtWidgets import QWidget
 from enum import Enum
 from datetime import datetime
+from collections import deque
+from types import MappingProxyType
+import itertools
 import json
+import time
 
 class EventType(Enum):
     """System event types"""
@@ -33,11 +37,20 @@ class EventType(Enum):
 class SystemEvent:
     """System event data container"""
     
+    # Wall-clock anchor for converting monotonic timestamps back to datetimes
+    _wall_base = time.time()
+    _ns_base = time.monotonic_ns()
+    
     def __init__(self, event_type: EventType, data: Dict[str, Any], source_tab: str = "unknown"):
         self.event_type = event_type
         self.data = data
         self.source_tab = source_tab
-        self.timestamp = datetime.now()
+        self.timestamp_ns = time.monotonic_ns()
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Event time as a datetime, derived on demand for display"""
+        return datetime.fromtimestamp(self._wall_base + (self.timestamp_ns - self._ns_base) / 1e9)
 
 class EventBus(QObject):
     """Central event bus for tab communication"""
@@ -47,16 +60,23 @@ class EventBus(QObject):
     def __init__(self):
         super().__init__()
         self.subscribers = {}
+        self._any_subs = False
         print("🚌 Event Bus initialized")
     
     def emit_event(self, event: SystemEvent):
         """Emit an event to all subscribers"""
         try:
-            self.global_event.emit(event)
+            has_receivers = self.receivers(self.global_event) > 0
+            if not self._any_subs and not has_receivers:
+                return
+            
+            if has_receivers:
+                self.global_event.emit(event)
             
             # Notify specific subscribers
-            if event.event_type in self.subscribers:
-                for callback in self.subscribers[event.event_type]:
+            subs = self.subscribers.get(event.event_type)
+            if subs:
+                for callback in subs:
                     try:
                         callback(event)
                     except Exception as e:
@@ -67,9 +87,8 @@ class EventBus(QObject):
     
     def subscribe(self, event_type: EventType, callback: Callable):
         """Subscribe to specific event type"""
-        if event_type not in self.subscribers:
-            self.subscribers[event_type] = []
-        self.subscribers[event_type].append(callback)
+        self.subscribers.setdefault(event_type, []).append(callback)
+        self._any_subs = True
 
 class SharedDataManager:
     """Shared data storage between tabs"""
@@ -79,16 +98,22 @@ class SharedDataManager:
         print("📊 Shared Data Manager initialized")
     
     def set_data(self, key: str, value: Any):
-        """Set shared data"""
-        self.data[key] = value
+        """Set shared data (copy-on-write, so published snapshots never change)"""
+        new_data = dict(self.data)
+        new_data[key] = value
+        self.data = new_data
     
     def get_data(self, key: str, default: Any = None) -> Any:
         """Get shared data"""
         return self.data.get(key, default)
     
+    def snapshot(self) -> MappingProxyType:
+        """Get a read-only view of the current data for repeated reads"""
+        return MappingProxyType(self.data)
+    
     def clear_data(self):
         """Clear all shared data"""
-        self.data.clear()
+        self.data = {}
 
 class TabIntegrationManager:
     """Manages tab integration and communication"""
@@ -124,7 +149,10 @@ class WorkflowEngine:
         self.event_bus = event_bus
         self.shared_data = shared_data
         self.workflows = {}
-        self.execution_history = []
+        # Bounded so long-running sessions don't retain every execution forever
+        self.execution_history = deque(maxlen=1000)
+        self.executions_total = 0
+        self._exec_seq = itertools.count()
         print("⚙️ Workflow Engine initialized")
     
     def register_workflow(self, name: str, workflow_func: Callable):
@@ -137,7 +165,7 @@ class WorkflowEngine:
         if name not in self.workflows:
             raise ValueError(f"Workflow '{name}' not found")
         
-        execution_id = f"{name}_{len(self.execution_history)}"
+        execution_id = f"{name}_{next(self._exec_seq)}"
         
         try:
             result = self.workflows[name](params or {})
@@ -148,6 +176,7 @@ class WorkflowEngine:
                 'result': result,
                 'timestamp': datetime.now()
             })
+            self.executions_total += 1
             print(f"✅ Executed workflow '{name}' -> {execution_id}")
             return execution_id
         except Exception as e:
@@ -198,7 +227,7 @@ class StreamingStudioIntegration:
         return {
             "tabs": list(self.tab_manager.integrated_tabs.keys()),
             "workflows": list(self.workflow_engine.workflows.keys()),
-            "events_processed": len(self.workflow_engine.execution_history),
+            "events_processed": self.workflow_engine.executions_total,
             "timestamp": datetime.now().isoformat()
         }
 
@@ -7,6 +7,8 @@ Ubuntu server-рүү тест stream илгээх
 import subprocess
 import sys
 import time
+import threading
+from collections import deque
 from pathlib import Path
 
 def test_streaming_to_ubuntu():
@@ -56,14 +58,24 @@ def test_streaming_to_ubuntu():
         print("📺 You can watch at: http://192.168.1.50:8080/hls/test_stream.m3u8")
         print("")
         
-        # Start streaming
+        # Start streaming; only the tail of FFmpeg's progress output is kept
         process = subprocess.Popen(ffmpeg_cmd, 
-                                 stdout=subprocess.PIPE, 
+                                 stdout=subprocess.DEVNULL, 
                                  stderr=subprocess.PIPE,
                                  text=True)
         
+        stderr_tail = deque(maxlen=50)
+        
+        def drain_stderr():
+            for line in process.stderr:
+                stderr_tail.append(line)
+        
+        reader = threading.Thread(target=drain_stderr, daemon=True)
+        reader.start()
+        
         # Wait for 30 seconds or until process finishes
-        stdout, stderr = process.communicate(timeout=35)
+        process.wait(timeout=35)
+        reader.join(timeout=5)
         
         if process.returncode == 0:
             print("✅ Stream completed successfully!")
@@ -71,11 +83,12 @@ def test_streaming_to_ubuntu():
             return True
         else:
             print("❌ Stream failed")
-            print(f"Error: {stderr[-500:]}")  # Last 500 chars of error
+            print(f"Error: {''.join(stderr_tail)}")
             return False
             
     except subprocess.TimeoutExpired:
         process.kill()
+        process.wait()
         print("✅ Stream timed out (normal - 30 second test)")
         print("🎉 Ubuntu server streaming test PASSED!")
         return True
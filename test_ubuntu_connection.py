@@ -4,115 +4,217 @@ Ubuntu Server Connection Test
 Ubuntu server-тай холболт шалгах script
 """
 
+import io
+import os
+import functools
 import socket
+import selectors
+import struct
+import time
 import requests
-import subprocess
+from requests.adapters import HTTPAdapter
+import threading
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
 
 # Server мэдээлэл
 UBUNTU_SERVER_IP = "192.168.1.50"
 RTMP_PORT = 1935
 HTTP_PORT = 8080
+BASE_URL = f"http://{UBUNTU_SERVER_IP}:{HTTP_PORT}"
+
+# Shared keep-alive session for all HTTP probes against the server; one
+# host pool with room for every concurrent probe (/stat, /health, 5x HLS)
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=10, max_retries=0))
+
+# Name resolution is cached for the duration of run_full_test so the
+# parallel probes don't each repeat getaddrinfo for the same server
+_real_getaddrinfo = socket.getaddrinfo
+
+@functools.lru_cache(maxsize=128)
+def _cached_getaddrinfo(*args, **kwargs):
+    return _real_getaddrinfo(*args, **kwargs)
+
+# Per-thread output buffer so parallel tests don't interleave their lines
+_output = threading.local()
+_print_lock = threading.Lock()
+
+def log(*args):
+    """Print, or buffer into the running test's output when tests run in parallel"""
+    buffer = getattr(_output, 'buffer', None)
+    if buffer is None:
+        print(*args)
+    else:
+        print(*args, file=buffer)
+
+def _run_buffered(test_func):
+    """Run a test with its output captured; returns (result, output)"""
+    _output.buffer = io.StringIO()
+    try:
+        return test_func(), _output.buffer.getvalue()
+    finally:
+        _output.buffer = None
+
+def tcp_probe(host, port, deadline=2.0):
+    """Non-blocking TCP connect; True if the handshake completes within deadline"""
+    sockaddr = socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_STREAM)[0][4]
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock, \
+            selectors.DefaultSelector() as selector:
+        # Close with RST rather than FIN so repeated runs don't pile up TIME_WAIT sockets
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+        sock.setblocking(False)
+        try:
+            sock.connect(sockaddr)
+        except BlockingIOError:
+            pass
+        except OSError:
+            # Refused or unreachable without waiting
+            return False
+        
+        selector.register(sock, selectors.EVENT_WRITE)
+        if not selector.select(deadline):
+            return False
+        return sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+
+def _icmp_checksum(data):
+    """RFC 1071 internet checksum"""
+    if len(data) % 2:
+        data += b'\x00'
+    total = sum(struct.unpack(f'!{len(data) // 2}H', data))
+    total = (total >> 16) + (total & 0xffff)
+    total += total >> 16
+    return ~total & 0xffff
+
+def _icmp_ping(sock, host, timeout=1.0):
+    """Send one ICMP echo request on an unprivileged ping socket; returns RTT in seconds"""
+    ident = os.getpid() & 0xffff
+    payload = b'tv-stream-ping'
+    header = struct.pack('!BBHHH', 8, 0, 0, ident, 1)
+    checksum = _icmp_checksum(header + payload)
+    packet = struct.pack('!BBHHH', 8, 0, checksum, ident, 1) + payload
+    
+    sock.settimeout(timeout)
+    start = time.perf_counter()
+    sock.sendto(packet, (host, 0))
+    sock.recv(1024)
+    return time.perf_counter() - start
+
+def _tcp_ping(host, port, timeout=2.0):
+    """Time a TCP handshake; a refused connection still proves the host is up"""
+    start = time.perf_counter()
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            pass
+    except ConnectionRefusedError:
+        pass
+    return time.perf_counter() - start
 
 def test_network_ping():
     """Network ping тест"""
-    print("🌐 Network ping тест...")
+    log("🌐 Network ping тест...")
     try:
-        result = subprocess.run(['ping', '-n', '4', UBUNTU_SERVER_IP], 
-                              capture_output=True, text=True, timeout=15)
-        if result.returncode == 0:
-            print(f"✅ Ping success to {UBUNTU_SERVER_IP}")
-            # Extract average time
-            lines = result.stdout.split('\n')
-            for line in lines:
-                if 'Average' in line:
-                    print(f"   📊 {line.strip()}")
-            return True
-        else:
-            print(f"❌ Ping failed to {UBUNTU_SERVER_IP}")
-            return False
+        try:
+            # Unprivileged ICMP (Linux ping_group_range); not available everywhere
+            icmp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+        except OSError:
+            icmp_sock = None
+        
+        rtt = None
+        if icmp_sock is not None:
+            with icmp_sock:
+                try:
+                    rtt = _icmp_ping(icmp_sock, UBUNTU_SERVER_IP)
+                    method = "ICMP"
+                except OSError:
+                    # ICMP is often filtered; the RTMP port still shows whether the host is up
+                    pass
+        
+        if rtt is None:
+            rtt = _tcp_ping(UBUNTU_SERVER_IP, RTMP_PORT)
+            method = f"TCP :{RTMP_PORT}"
+        
+        log(f"✅ Ping success to {UBUNTU_SERVER_IP}")
+        log(f"   📊 {method} round trip: {rtt * 1000:.1f} ms")
+        return True
     except Exception as e:
-        print(f"❌ Ping error: {e}")
+        log(f"❌ Ping failed to {UBUNTU_SERVER_IP}: {e}")
         return False
 
 def test_rtmp_port():
     """RTMP port (1935) холболт тест"""
-    print(f"📡 RTMP port {RTMP_PORT} тест...")
+    log(f"📡 RTMP port {RTMP_PORT} тест...")
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(10)
-        result = sock.connect_ex((UBUNTU_SERVER_IP, RTMP_PORT))
-        sock.close()
-        
-        if result == 0:
-            print(f"✅ RTMP port {RTMP_PORT} accessible")
+        if tcp_probe(UBUNTU_SERVER_IP, RTMP_PORT):
+            log(f"✅ RTMP port {RTMP_PORT} accessible")
             return True
         else:
-            print(f"❌ RTMP port {RTMP_PORT} not accessible")
+            log(f"❌ RTMP port {RTMP_PORT} not accessible")
             return False
     except Exception as e:
-        print(f"❌ RTMP port test error: {e}")
+        log(f"❌ RTMP port test error: {e}")
         return False
 
 def test_http_port():
     """HTTP port (8080) холболт тест"""
-    print(f"🌐 HTTP port {HTTP_PORT} тест...")
+    log(f"🌐 HTTP port {HTTP_PORT} тест...")
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(10)
-        result = sock.connect_ex((UBUNTU_SERVER_IP, HTTP_PORT))
-        sock.close()
-        
-        if result == 0:
-            print(f"✅ HTTP port {HTTP_PORT} accessible")
+        if tcp_probe(UBUNTU_SERVER_IP, HTTP_PORT):
+            log(f"✅ HTTP port {HTTP_PORT} accessible")
             return True
         else:
-            print(f"❌ HTTP port {HTTP_PORT} not accessible")
+            log(f"❌ HTTP port {HTTP_PORT} not accessible")
             return False
     except Exception as e:
-        print(f"❌ HTTP port test error: {e}")
+        log(f"❌ HTTP port test error: {e}")
         return False
 
 def test_nginx_status():
     """Nginx status API тест"""
-    print("📊 Nginx status тест...")
+    log("📊 Nginx status тест...")
     try:
-        url = f"http://{UBUNTU_SERVER_IP}:{HTTP_PORT}/stat"
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(f"{BASE_URL}/stat", timeout=10)
         
         if response.status_code == 200:
-            print("✅ Nginx stats accessible")
-            print(f"   📄 Response length: {len(response.text)} chars")
+            log("✅ Nginx stats accessible")
+            log(f"   📄 Response length: {len(response.text)} chars")
             return True
         else:
-            print(f"❌ Nginx stats error: HTTP {response.status_code}")
+            log(f"❌ Nginx stats error: HTTP {response.status_code}")
             return False
     except Exception as e:
-        print(f"❌ Nginx status test error: {e}")
+        log(f"❌ Nginx status test error: {e}")
         return False
 
 def test_health_endpoint():
     """Health check endpoint тест"""
-    print("💊 Health endpoint тест...")
+    log("💊 Health endpoint тест...")
     try:
-        url = f"http://{UBUNTU_SERVER_IP}:{HTTP_PORT}/health"
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(f"{BASE_URL}/health", timeout=10)
         
         if response.status_code == 200:
-            print("✅ Health endpoint OK")
-            print(f"   📄 Response: {response.text.strip()}")
+            log("✅ Health endpoint OK")
+            log(f"   📄 Response: {response.text.strip()}")
             return True
         else:
-            print(f"❌ Health endpoint error: HTTP {response.status_code}")
+            log(f"❌ Health endpoint error: HTTP {response.status_code}")
             return False
     except Exception as e:
-        print(f"❌ Health endpoint test error: {e}")
+        log(f"❌ Health endpoint test error: {e}")
         return False
 
 def test_hls_directories():
     """HLS directory accessibility тест"""
-    print("📁 HLS directories тест...")
+    log("📁 HLS directories тест...")
     hls_paths = [
         "/hls/",
         "/hls/720p/", 
@@ -121,21 +223,26 @@ def test_hls_directories():
         "/hls3/"
     ]
     
-    success_count = 0
-    for path in hls_paths:
+    def probe(path):
         try:
-            url = f"http://{UBUNTU_SERVER_IP}:{HTTP_PORT}{path}"
-            response = requests.get(url, timeout=5)
-            
-            if response.status_code in [200, 403, 404]:  # 403/404 are OK - means directory exists
-                print(f"   ✅ {path} accessible")
-                success_count += 1
-            else:
-                print(f"   ❌ {path} error: HTTP {response.status_code}")
+            return SESSION.get(f"{BASE_URL}{path}", timeout=5).status_code, None
         except Exception as e:
-            print(f"   ❌ {path} error: {e}")
+            return None, e
+    
+    with ThreadPoolExecutor(max_workers=len(hls_paths)) as executor:
+        probe_results = list(executor.map(probe, hls_paths))
     
-    print(f"📊 HLS directories: {success_count}/{len(hls_paths)} accessible")
+    success_count = 0
+    for path, (status_code, error) in zip(hls_paths, probe_results):
+        if error is not None:
+            log(f"   ❌ {path} error: {error}")
+        elif status_code in [200, 403, 404]:  # 403/404 are OK - means directory exists
+            log(f"   ✅ {path} accessible")
+            success_count += 1
+        else:
+            log(f"   ❌ {path} error: HTTP {status_code}")
+    
+    log(f"📊 HLS directories: {success_count}/{len(hls_paths)} accessible")
     return success_count > 0
 
 def run_full_test():
@@ -146,26 +253,45 @@ def run_full_test():
     print(f"🎯 Target server: {UBUNTU_SERVER_IP}")
     print("=" * 60)
     
-    results = {}
-    
-    # Run all tests
-    results['ping'] = test_network_ping()
-    print()
-    
-    results['rtmp_port'] = test_rtmp_port()
-    print()
-    
-    results['http_port'] = test_http_port()
-    print()
-    
-    results['nginx_status'] = test_nginx_status()
-    print()
+    # Dependency DAG: (name, test, parent); a test is skipped when its parent failed
+    tests = [
+        ('ping', test_network_ping, None),
+        ('rtmp_port', test_rtmp_port, 'ping'),
+        ('http_port', test_http_port, 'ping'),
+        ('nginx_status', test_nginx_status, 'http_port'),
+        ('health', test_health_endpoint, 'http_port'),
+        ('hls_dirs', test_hls_directories, 'http_port'),
+    ]
     
-    results['health'] = test_health_endpoint()
-    print()
+    # Run each stage's tests in parallel; each test's output is printed as one block
+    completed = {}
+    skipped = set()
+    pending = tests
+    _cached_getaddrinfo.cache_clear()
+    socket.getaddrinfo = _cached_getaddrinfo
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            while pending:
+                ready = [t for t in pending if t[2] is None or t[2] in completed]
+                pending = [t for t in pending if t[2] is not None and t[2] not in completed]
+                
+                futures = {}
+                for name, func, parent in ready:
+                    if parent is not None and not completed[parent]:
+                        completed[name] = False
+                        skipped.add(name)
+                    else:
+                        futures[executor.submit(_run_buffered, func)] = name
+                
+                for future in as_completed(futures):
+                    result, output = future.result()
+                    completed[futures[future]] = result
+                    with _print_lock:
+                        print(output)
+    finally:
+        socket.getaddrinfo = _real_getaddrinfo
     
-    results['hls_dirs'] = test_hls_directories()
-    print()
+    results = {name: completed[name] for name, _, _ in tests}
     
     # Summary
     print("=" * 60)
@@ -176,7 +302,10 @@ def run_full_test():
     passed_tests = sum(1 for result in results.values() if result)
     
     for test_name, result in results.items():
-        status = "✅ PASS" if result else "❌ FAIL"
+        if test_name in skipped:
+            status = "⏭️ SKIP"
+        else:
+            status = "✅ PASS" if result else "❌ FAIL"
         print(f"{test_name.upper():<15} {status}")
     
     print("-" * 60)
@@ -191,14 +320,13 @@ def run_full_test():
     
     print("=" * 60)
     
-    # Save results
-    with open('server_test_results.json', 'w') as f:
-        json.dump({
-            'timestamp': datetime.now().isoformat(),
-            'server': UBUNTU_SERVER_IP,
-            'results': results,
-            'summary': f"{passed_tests}/{total_tests}"
-        }, f, indent=2)
+    # Save results (compact, machine-consumed) in a single write
+    Path('server_test_results.json').write_bytes(_json_dumps({
+        'timestamp': datetime.now().isoformat(),
+        'server': UBUNTU_SERVER_IP,
+        'results': results,
+        'summary': f"{passed_tests}/{total_tests}"
+    }))
     
     print("💾 Test results saved to: server_test_results.json")
     
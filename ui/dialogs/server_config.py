@@ -7,9 +7,16 @@ Fixed Server Configuration Dialog with Auto-Update and Standardized Sizes
 import sys
 import json
 import os
+import re
+import socket
+import string
+import shutil
+import tempfile
+import functools
+from contextlib import contextmanager
 from pathlib import Path
 import datetime
-from typing import Dict, Optional, Any
+from typing import Dict, Iterable, Optional, Any
 from dataclasses import dataclass, asdict
 
 from PyQt6.QtWidgets import *
@@ -24,11 +31,70 @@ except ImportError:
     def get_logger(name):
         return logging.getLogger(name)
 
+# Optional fast JSON backend; both variants read/write UTF-8 bytes
+try:
+    import orjson
+    
+    def _json_loads(raw: bytes):
+        return orjson.loads(raw)
+    
+    def _json_dumps(obj, indent: bool = True) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+except ImportError:
+    def _json_loads(raw: bytes):
+        return json.loads(raw)
+    
+    def _json_dumps(obj, indent: bool = True) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+# Mode a plain open() would create files with; mkstemp always uses 0600
+_umask = os.umask(0)
+os.umask(_umask)
+_NEW_FILE_MODE = 0o666 & ~_umask
+del _umask
+
+
+def _atomic_write(path, chunks: Iterable[bytes]):
+    """Write chunks to a temp file beside path, fsync it and swap it in, so path is never left truncated"""
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.writelines(chunks)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_name, _NEW_FILE_MODE)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
 
 # =============================================================================
 # SERVER CONFIGURATION MODEL
 # =============================================================================
 
+# URL schemes indexed by ssl_enabled (False -> 0, True -> 1)
+_RTMP_PROTOCOLS = ("rtmp", "rtmps")
+_HTTP_PROTOCOLS = ("http", "https")
+
+# Host cleaning/validation patterns, compiled once for the live URL preview
+_HOST_STRIP_RE = re.compile(r'[^a-zA-Z0-9.\-_:]')
+_HOST_ALLOWED = frozenset(string.ascii_letters + string.digits + ".-_:")
+# str.translate table deleting every disallowed ASCII char; the regex is only needed for non-ASCII input
+_HOST_STRIP_TABLE = str.maketrans('', '', ''.join(chr(c) for c in range(128) if chr(c) not in _HOST_ALLOWED))
+_HOST_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'^[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)*$',
+    r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$',
+    r'^[0-9a-fA-F:]+$',
+    r'^[a-zA-Z0-9._-]+$'
+))
+
+
 @dataclass
 class ServerConfig:
     """Server configuration data class"""
@@ -56,28 +122,31 @@ class ServerConfig:
         protocol = "https" if self.ssl_enabled else "http"
         return f"{protocol}://{self.host}:{self.port}{self.api_endpoint}"
 
+    @property
+    def display_text(self) -> str:
+        """Get list label (lock icon for SSL servers)"""
+        return f"{'🔒' if self.ssl_enabled else '🌐'} {self.name}"
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return asdict(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ServerConfig':
-        """Create from dictionary"""
-        defaults = {
-            'ssl_enabled': False,
-            'api_endpoint': '/api/v1',
-            'stream_endpoint': '/live',
-            'username': None,
-            'password': None,
-            'max_streams': 10,
-            'description': ''
-        }
-        
-        config_data = {**defaults, **data}
-        valid_fields = {field.name for field in cls.__dataclass_fields__.values()}
-        filtered_data = {k: v for k, v in config_data.items() if k in valid_fields}
-        
-        return cls(**filtered_data)
+        """Create from dictionary (unknown keys are ignored)"""
+        return cls(
+            name=data['name'],
+            host=data['host'],
+            port=data['port'],
+            rtmp_port=data['rtmp_port'],
+            ssl_enabled=data.get('ssl_enabled', False),
+            api_endpoint=data.get('api_endpoint', "/api/v1"),
+            stream_endpoint=data.get('stream_endpoint', "/live"),
+            username=data.get('username'),
+            password=data.get('password'),
+            max_streams=data.get('max_streams', 10),
+            description=data.get('description', ""),
+        )
 
 
 # =============================================================================
@@ -93,12 +162,30 @@ class ServerStorageManager(QObject):
     server_updated = pyqtSignal(str, object)  # server_id, ServerConfig
     server_removed = pyqtSignal(str)  # server_id
     
+    # Number of rotating backups kept next to the config file
+    BACKUP_COUNT = 5
+    
     def __init__(self, config_file: str = "servers.json"):
         super().__init__()
         # ФАЙЛЫН ЗАМЫГ СТАНДАРТ БОЛГОХ
         self.config_file = Path(config_file)
         self.logger = get_logger(__name__)
         
+        # Parsed servers cached in memory; reloaded only when the file changes on disk
+        self._servers: Optional[Dict[str, ServerConfig]] = None
+        self._version: Optional[tuple] = None
+        self._dirty = False
+        
+        # Nesting depth of batch(); per-server signals are held back while > 0
+        self._batch_depth = 0
+        
+        # Bursts of saves produce a single servers_changed notification;
+        # the per-item added/updated/removed signals stay immediate
+        self._changed_timer = QTimer(self)
+        self._changed_timer.setSingleShot(True)
+        self._changed_timer.setInterval(100)
+        self._changed_timer.timeout.connect(self.servers_changed)
+        
         # Create config directory if it doesn't exist
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
         
@@ -106,11 +193,58 @@ class ServerStorageManager(QObject):
         if not self.config_file.exists():
             self.save_servers({})
     
+    def file_version(self) -> Optional[tuple]:
+        """Opaque version of the config file on disk; None if it is missing"""
+        # mtime alone misses same-tick rewrites and coarse filesystem clocks;
+        # an atomic replace also changes the inode
+        try:
+            st = self.config_file.stat()
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+    
+    def is_current(self, version: Optional[tuple]) -> bool:
+        """True if the given file version is the one this manager last loaded or saved"""
+        return version is not None and version == self._version
+    
+    def _get_servers(self) -> Dict[str, ServerConfig]:
+        """Get the cached servers, reloading if the file was changed externally"""
+        if self._dirty:
+            # Unsaved edits pending; the in-memory copy is authoritative
+            return self._servers
+        
+        version = self.file_version()
+        if self._servers is None or version != self._version:
+            self._servers = self.load_servers()
+            self._version = version
+        return self._servers
+    
+    def _commit(self):
+        """Save the cached servers now, or when the enclosing batch() exits"""
+        self._dirty = True
+        if not self._batch_depth:
+            self.flush()
+    
+    def flush(self):
+        """Write pending server changes to disk immediately"""
+        if self._dirty:
+            self.save_servers(self._servers)
+    
+    @contextmanager
+    def batch(self):
+        """Group bulk changes: no per-server signals, one write and one servers_changed on exit"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+    
     def load_servers(self) -> Dict[str, ServerConfig]:
         """Load servers from file"""
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _json_loads(self.config_file.read_bytes())
             
             servers = {}
             for server_id, server_data in data.get('servers', {}).items():
@@ -134,72 +268,454 @@ class ServerStorageManager(QObject):
     def save_servers(self, servers: Dict[str, ServerConfig]):
         """Save servers to file"""
         try:
-            servers_data = {}
-            for server_id, server_config in servers.items():
-                servers_data[server_id] = server_config.to_dict()
-            
             if self.config_file.exists():
-                backup_file = self.config_file.with_suffix(f'.backup_{datetime.datetime.now().strftime("%Y%m%d_%H%M%S")}.json')
-                self.config_file.rename(backup_file)
-                
-                backup_files = sorted(self.config_file.parent.glob(f'{self.config_file.stem}.backup_*.json'))
-                for old_backup in backup_files[:-5]:
-                    old_backup.unlink()
+                self._backup_config()
             
-            config_data = {
-                "version": "1.0",
-                "last_updated": datetime.datetime.now().isoformat(),
-                "servers": servers_data
-            }
+            # Swapped in atomically so the live config is never missing or truncated
+            _atomic_write(self.config_file, self._iter_config(servers))
             
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
+            self._dirty = False
+            self._servers = dict(servers)
+            self._version = self.file_version()
             
             self.logger.info(f"Saved {len(servers)} servers to {self.config_file}")
-            # Emit signal for auto-update
-            self.servers_changed.emit()
+            # Schedule signal for auto-update
+            self._changed_timer.start()
             
         except Exception as e:
             self.logger.error(f"Failed to save servers: {e}")
+            # The cache may hold the edits that failed to save; reread the file next time
+            self._servers = None
+            self._dirty = False
             raise
     
+    def _iter_config(self, servers: Dict[str, ServerConfig]) -> Iterable[bytes]:
+        """Yield the config envelope and one server per line, without building the full document"""
+        timestamp = datetime.datetime.now().isoformat()
+        yield (b'{\n  "version": "1.0",\n  "last_updated": ' + _json_dumps(timestamp)
+               + b',\n  "servers": {')
+        separator = b'\n    '
+        for server_id, server_config in servers.items():
+            yield (separator + _json_dumps(server_id) + b': '
+                   + _json_dumps(server_config.to_dict(), indent=False))
+            separator = b',\n    '
+        yield b'\n  }\n}\n'
+    
+    def _backup_config(self):
+        """Copy the current config over the oldest slot of a fixed backup ring"""
+        # Chosen from the files on disk, so short-lived managers and separate
+        # processes rotate through the same ring; a missing slot counts as oldest
+        def slot_mtime(path: Path) -> int:
+            try:
+                return path.stat().st_mtime_ns
+            except OSError:
+                return -1
+        
+        slots = [self.config_file.with_suffix(f'.backup_{i}.json') for i in range(self.BACKUP_COUNT)]
+        shutil.copy2(self.config_file, min(slots, key=slot_mtime))
+    
     def add_server(self, server_id: str, server_config: ServerConfig):
         """Add a new server"""
-        servers = self.load_servers()
+        servers = self._get_servers()
         servers[server_id] = server_config
-        self.save_servers(servers)
-        self.server_added.emit(server_id, server_config)
+        self._commit()
+        if not self._batch_depth:
+            self.server_added.emit(server_id, server_config)
     
     def update_server(self, server_id: str, server_config: ServerConfig):
         """Update existing server"""
-        servers = self.load_servers()
+        servers = self._get_servers()
         if server_id in servers:
             servers[server_id] = server_config
-            self.save_servers(servers)
-            self.server_updated.emit(server_id, server_config)
+            self._commit()
+            if not self._batch_depth:
+                self.server_updated.emit(server_id, server_config)
         else:
             raise KeyError(f"Server {server_id} not found")
     
     def remove_server(self, server_id: str):
         """Remove server"""
-        servers = self.load_servers()
+        servers = self._get_servers()
         if server_id in servers:
             del servers[server_id]
-            self.save_servers(servers)
-            self.server_removed.emit(server_id)
+            self._commit()
+            if not self._batch_depth:
+                self.server_removed.emit(server_id)
         else:
             raise KeyError(f"Server {server_id} not found")
     
     def get_server(self, server_id: str) -> Optional[ServerConfig]:
         """Get specific server"""
-        servers = self.load_servers()
-        return servers.get(server_id)
+        return self._get_servers().get(server_id)
 
 
 # =============================================================================
 # SERVER EDIT DIALOG - STANDARDIZED SIZE
 # =============================================================================
 
+# Set once on the dialog so Qt parses it a single time; widgets opt in
+# through their objectName or the "role" dynamic property
+_EDIT_DIALOG_QSS = """
+    QLabel#headerLabel {
+        font-size: 15px;
+        font-weight: bold;
+        font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
+        padding: 8px 12px;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #34495e, stop:1 #2c3e50);
+        color: white;
+        border-radius: 4px;
+        text-align: center;
+    }
+    QScrollArea {
+        border: none;
+        background-color: transparent;
+    }
+    QScrollBar:vertical {
+        background-color: #ecf0f1;
+        width: 10px;
+        border-radius: 5px;
+    }
+    QScrollBar::handle:vertical {
+        background-color: #bdc3c7;
+        border-radius: 5px;
+        min-height: 20px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background-color: #95a5a6;
+    }
+    QGroupBox {
+        font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
+        font-size: 13px;
+        font-weight: bold;
+        color: #2c3e50;
+        border: 2px solid #bdc3c7;
+        border-radius: 6px;
+        margin-top: 10px;
+        padding-top: 10px;
+        background-color: #ffffff;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 12px;
+        padding: 0 8px 0 8px;
+        background-color: white;
+        color: #34495e;
+        font-weight: bold;
+    }
+    QLineEdit, QSpinBox, QTextEdit {
+        font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
+        font-size: 11px;
+        padding: 8px 10px;
+        border: 2px solid #ddd;
+        border-radius: 5px;
+        background-color: #ffffff;
+        color: #2c3e50;
+        selection-background-color: #3498db;
+        selection-color: #ffffff;
+        min-height: 18px;
+    }
+    QLineEdit:focus, QSpinBox:focus, QTextEdit:focus {
+        border-color: #3498db;
+        background-color: #f8f9fa;
+        color: #2c3e50;
+    }
+    QLineEdit:hover, QSpinBox:hover, QTextEdit:hover {
+        border-color: #95a5a6;
+        color: #2c3e50;
+    }
+    QTextEdit {
+        line-height: 1.3;
+    }
+    QSpinBox::up-button, QSpinBox::down-button {
+        subcontrol-origin: border;
+        width: 18px;
+        border-left: 1px solid #ddd;
+        background-color: #ecf0f1;
+    }
+    QSpinBox::up-button:hover, QSpinBox::down-button:hover {
+        background-color: #bdc3c7;
+    }
+    QLabel[role="field"] {
+        font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
+        font-size: 11px;
+        font-weight: 600;
+        color: #34495e;
+        margin-bottom: 4px;
+    }
+    QCheckBox {
+        font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
+        font-size: 11px;
+        padding: 6px;
+        color: #34495e;
+    }
+    QCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+        border: 2px solid #bdc3c7;
+        border-radius: 3px;
+        background-color: white;
+    }
+    QCheckBox::indicator:hover {
+        border-color: #3498db;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #3498db;
+        border-color: #3498db;
+        color: white;
+    }
+    QPushButton#passwordToggle {
+        border: 2px solid #ddd;
+        border-radius: 5px;
+        background-color: white;
+        font-size: 12px;
+    }
+    QPushButton#passwordToggle:checked {
+        background-color: #3498db;
+        border-color: #3498db;
+        color: white;
+    }
+    QPushButton#passwordToggle:hover {
+        border-color: #95a5a6;
+    }
+    QLabel#previewHint {
+        font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
+        color: #7f8c8d;
+        font-style: italic;
+        font-size: 10px;
+        margin-bottom: 6px;
+    }
+    QLabel[role="url"] {
+        font-family: 'Consolas', 'Courier New', monospace;
+        font-size: 10px;
+        color: #2c3e50;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #ffffff, stop:1 #f8f9fa);
+        padding: 8px 10px;
+        border-radius: 5px;
+        border: 2px solid #e9ecef;
+        min-height: 14px;
+        word-wrap: break-word;
+    }
+    QLabel[role="url"]:hover {
+        border-color: #3498db;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #f8f9fa, stop:1 #e9ecef);
+    }
+    QPushButton[role="action"] {
+        font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
+        font-size: 11px;
+        font-weight: bold;
+        padding: 8px 16px;
+        border-radius: 5px;
+        border: none;
+        min-width: 80px;
+        min-height: 32px;
+        color: white;
+    }
+    QPushButton#testButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #3498db, stop:1 #2980b9);
+    }
+    QPushButton#testButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #2980b9, stop:1 #21618c);
+    }
+    QPushButton#cancelButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #95a5a6, stop:1 #7f8c8d);
+    }
+    QPushButton#cancelButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #7f8c8d, stop:1 #6c7b7d);
+    }
+    QPushButton#saveButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #27ae60, stop:1 #229954);
+    }
+    QPushButton#saveButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #229954, stop:1 #1e7e34);
+    }
+    QPushButton#saveButton:default {
+        border: 2px solid #ffffff;
+    }
+"""
+
+
+# Connection test dialog; set once on the dialog, widgets are selected by objectName
+_TEST_DIALOG_QSS = """
+    QDialog {
+        background-color: #f8f9fa;
+        font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
+    }
+    QLabel#testHeader {
+        font-size: 16px;
+        font-weight: bold;
+        color: #2c3e50;
+        padding: 12px;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #ecf0f1, stop:1 #bdc3c7);
+        border-radius: 6px;
+        text-align: center;
+    }
+    QPushButton#copyRtmpBtn, QPushButton#copyApiBtn, QPushButton#closeBtn {
+        font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
+        color: white;
+        font-weight: bold;
+        padding: 8px 16px;
+        border-radius: 5px;
+        border: none;
+        min-height: 30px;
+    }
+    QPushButton#copyRtmpBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #3498db, stop:1 #2980b9);
+    }
+    QPushButton#copyRtmpBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #2980b9, stop:1 #21618c);
+    }
+    QPushButton#copyApiBtn {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #9b59b6, stop:1 #8e44ad);
+    }
+    QPushButton#copyApiBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #8e44ad, stop:1 #7d3c98);
+    }
+    QPushButton#closeBtn {
+        padding: 8px 20px;
+        min-width: 70px;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #27ae60, stop:1 #229954);
+    }
+    QPushButton#closeBtn:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #229954, stop:1 #1e7e34);
+    }
+    QPushButton#closeBtn:default {
+        border: 2px solid #ffffff;
+    }
+"""
+
+# Connection test report; shared CSS lives in one <style> block instead of per-cell attributes
+_TEST_HTML_TEMPLATE = """
+<style>
+    div.report {{ font-family: 'Segoe UI', sans-serif; line-height: 1.5; font-size: 12px; }}
+    h3 {{ color: #27ae60; margin-bottom: 12px; }}
+    h4 {{ color: #34495e; margin-bottom: 8px; }}
+    table {{ width: 100%; border-collapse: collapse; margin-bottom: 12px; border: 1px solid #ddd; }}
+    td {{ padding: 8px; border: 1px solid #ddd; }}
+    td.key {{ font-weight: bold; background: #ecf0f1; }}
+    td.value {{ background: #f8f9fa; }}
+    div.url {{ padding: 10px; border-radius: 6px; margin: 6px 0; }}
+    div.rtmp {{ background: #e8f5e8; border-left: 3px solid #27ae60; }}
+    div.api {{ background: #e3f2fd; border-left: 3px solid #2196f3; }}
+    code {{ background: #ffffff; padding: 4px; border-radius: 3px; font-family: 'Consolas', monospace;
+            word-break: break-all; display: block; margin-top: 4px; }}
+</style>
+<div class="report">
+<h3>✅ Тохиргоо Зөв</h3>
+
+<h4>Серверийн Мэдээлэл:</h4>
+<table>
+<tr><td class="key" width="40%">Нэр:</td><td class="value">{name}</td></tr>
+<tr><td class="key">Хост:</td><td class="value">{host}</td></tr>
+<tr><td class="key">HTTP Порт:</td><td class="value">{port}</td></tr>
+<tr><td class="key">RTMP Порт:</td><td class="value">{rtmp_port}</td></tr>
+<tr><td class="key">SSL:</td><td class="value">{ssl_str}</td></tr>
+</table>
+
+<h4>Үүссэн URL Хаягууд:</h4>
+<div class="url rtmp">
+<strong>RTMP URL:</strong><br/>
+<code>{rtmp_url}</code>
+</div>
+
+<div class="url api">
+<strong>API URL:</strong><br/>
+<code>{api_url}</code>
+</div>
+</div>"""
+
+
+@functools.lru_cache(maxsize=None)
+def _dialog_font() -> QFont:
+    """Shared dialog font; built on first use since QFont needs a running QApplication"""
+    return QFont("Segoe UI", 10)
+
+
+@functools.lru_cache(maxsize=128)
+def _clean_host_url(host: str) -> str:
+    """Clean and validate host URL"""
+    if not host or host.isspace():
+        return "localhost"
+    
+    host = host.strip()
+    
+    if "://" in host:
+        host = host.split("://", 1)[1]
+    
+    if "/" in host:
+        host = host.split("/")[0]
+    
+    if host.lower() in ["localhost", "127.0.0.1", "::1"]:
+        return "localhost"
+    
+    try:
+        if host.isascii():
+            cleaned = host.translate(_HOST_STRIP_TABLE)
+        else:
+            cleaned = _HOST_STRIP_RE.sub('', host)
+        
+        if not cleaned:
+            return "localhost"
+        
+        if _is_valid_host_format(cleaned):
+            return cleaned
+        else:
+            return "localhost"
+            
+    except Exception:
+        return "localhost"
+
+
+@functools.lru_cache(maxsize=128)
+def _is_valid_host_format(host: str) -> bool:
+    """Check if host format is valid"""
+    if not host:
+        return False
+    
+    if host.lower() == "localhost":
+        return True
+    
+    return any(pattern.match(host) for pattern in _HOST_PATTERNS)
+
+
+def _field_label(text: str) -> QLabel:
+    """Form label styled by the dialog stylesheet's field role"""
+    label = QLabel(text)
+    label.setProperty("role", "field")
+    return label
+
+
+def _text_or_none(line_edit: QLineEdit) -> Optional[str]:
+    """Stripped text of an optional field, or None when it is blank"""
+    return line_edit.text().strip() or None
+
+
+class ClickableLabel(QLabel):
+    """QLabel that emits its text when left-clicked"""
+
+    clicked = pyqtSignal(str)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.clicked.emit(self.text())
+        super().mousePressEvent(event)
+
+
 class ServerEditDialog(QDialog):
     """Dialog for editing server configuration with standardized size"""
 
@@ -217,6 +733,26 @@ class ServerEditDialog(QDialog):
         self.setSizeGripEnabled(True)
         self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
 
+        # Keystrokes within 50 ms of each other produce a single preview rebuild
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(50)
+        self._preview_timer.timeout.connect(self._update_preview)
+
+        # Last preview inputs/outputs, so unchanged edits don't touch the labels
+        self._last_preview_key = None
+        self._last_rtmp_url = self._last_api_url = ""
+
+        # Clipboard and tooltip rect reused by every URL copy
+        self._clipboard = QApplication.clipboard()
+        self._empty_rect = QRect()
+
+        # Connection test dialog, created lazily on the first test
+        self._test_dialog = None
+        self._test_results_label = None
+        self._test_rtmp_url = self._test_api_url = ""
+        self._localhost_warning_box = None
+
         self._init_ui()
 
         if server_config:
@@ -224,347 +760,125 @@ class ServerEditDialog(QDialog):
 
     def _init_ui(self):
         """Initialize dialog UI with improved layout and sizing"""
+        self.setStyleSheet(_EDIT_DIALOG_QSS)
+
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(8, 8, 8, 8)
         main_layout.setSpacing(8)
 
         # Main dialog font setting
-        main_font = QFont()
-        main_font.setFamily("Segoe UI")
-        main_font.setPointSize(10)
-        self.setFont(main_font)
+        self.setFont(_dialog_font())
 
         # Header - СТАНДАРТ ХЭМЖЭЭ
         header_label = QLabel("🖥️ Стриминг Сервер Удирдах")
-        header_label.setStyleSheet("""
-            QLabel {
-                font-size: 15px;
-                font-weight: bold;
-                font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
-                padding: 8px 12px;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #34495e, stop:1 #2c3e50);
-                color: white;
-                border-radius: 4px;
-                text-align: center;
-            }
-        """)
+        header_label.setObjectName("headerLabel")
         header_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         header_label.setFixedHeight(35)
         header_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         main_layout.addWidget(header_label)
 
-        # Scrollable content area
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            QScrollBar:vertical {
-                background-color: #ecf0f1;
-                width: 10px;
-                border-radius: 5px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #bdc3c7;
-                border-radius: 5px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #95a5a6;
-            }
-        """)
-        
         # Content widget
         content_widget = QWidget()
         content_layout = QVBoxLayout(content_widget)
         content_layout.setSpacing(12)
         content_layout.setContentsMargins(0, 4, 0, 0)
 
-        # Styling
-        group_style = """
-            QGroupBox {
-                font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
-                font-size: 13px;
-                font-weight: bold;
-                color: #2c3e50;
-                border: 2px solid #bdc3c7;
-                border-radius: 6px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #ffffff;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 8px 0 8px;
-                background-color: white;
-                color: #34495e;
-                font-weight: bold;
-            }
-        """
-
-        input_style = """
-            QLineEdit, QSpinBox, QTextEdit {
-                font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
-                font-size: 11px;
-                padding: 8px 10px;
-                border: 2px solid #ddd;
-                border-radius: 5px;
-                background-color: #ffffff;
-                color: #2c3e50;
-                selection-background-color: #3498db;
-                selection-color: #ffffff;
-                min-height: 18px;
-            }
-            QLineEdit:focus, QSpinBox:focus, QTextEdit:focus {
-                border-color: #3498db;
-                background-color: #f8f9fa;
-                color: #2c3e50;
-            }
-            QLineEdit:hover, QSpinBox:hover, QTextEdit:hover {
-                border-color: #95a5a6;
-                color: #2c3e50;
-            }
-            QSpinBox::up-button, QSpinBox::down-button {
-                subcontrol-origin: border;
-                width: 18px;
-                border-left: 1px solid #ddd;
-                background-color: #ecf0f1;
-            }
-            QSpinBox::up-button:hover, QSpinBox::down-button:hover {
-                background-color: #bdc3c7;
-            }
-        """
-
-        label_style = """
-            QLabel {
-                font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
-                font-size: 11px;
-                font-weight: 600;
-                color: #34495e;
-                margin-bottom: 4px;
-            }
-        """
-
         # Basic server settings group
         form_group = QGroupBox("Серверийн Үндсэн Мэдээлэл")
-        form_group.setStyleSheet(group_style)
         form_layout = QFormLayout(form_group)
         form_layout.setVerticalSpacing(10)
         form_layout.setHorizontalSpacing(12)
         form_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
 
         # Server name
-        name_label = QLabel("Серверийн Нэр:")
-        name_label.setStyleSheet(label_style)
         self.name_edit = QLineEdit()
         self.name_edit.setPlaceholderText("Жишээ: Орон нутгийн RTMP сервер")
-        self.name_edit.setStyleSheet(input_style)
-        form_layout.addRow(name_label, self.name_edit)
+        form_layout.addRow(_field_label("Серверийн Нэр:"), self.name_edit)
 
         # Host
-        host_label = QLabel("Хост Хаяг:")
-        host_label.setStyleSheet(label_style)
         self.host_edit = QLineEdit()
         self.host_edit.setPlaceholderText("Жишээ: localhost эсвэл rtmp.example.com")
-        self.host_edit.setStyleSheet(input_style)
-        form_layout.addRow(host_label, self.host_edit)
+        form_layout.addRow(_field_label("Хост Хаяг:"), self.host_edit)
 
-        # Ports section
-        ports_widget = QWidget()
-        ports_layout = QHBoxLayout(ports_widget)
-        ports_layout.setSpacing(12)
-        ports_layout.setContentsMargins(0, 0, 0, 0)
+        # Ports section - label above each spinbox, side by side
+        ports_grid = QGridLayout()
+        ports_grid.setHorizontalSpacing(12)
+        ports_grid.setVerticalSpacing(4)
+        ports_grid.setContentsMargins(0, 0, 0, 0)
 
         # HTTP Port
-        http_container = QWidget()
-        http_layout = QVBoxLayout(http_container)
-        http_layout.setContentsMargins(0, 0, 0, 0)
-        http_layout.setSpacing(4)
-
-        http_label = QLabel("HTTP Порт:")
-        http_label.setStyleSheet(label_style)
         self.port_edit = QSpinBox()
         self.port_edit.setRange(1, 65535)
         self.port_edit.setValue(8080)
-        self.port_edit.setStyleSheet(input_style)
         self.port_edit.setMinimumWidth(100)
 
-        http_layout.addWidget(http_label)
-        http_layout.addWidget(self.port_edit)
+        ports_grid.addWidget(_field_label("HTTP Порт:"), 0, 0)
+        ports_grid.addWidget(self.port_edit, 1, 0)
 
         # RTMP Port
-        rtmp_container = QWidget()
-        rtmp_layout = QVBoxLayout(rtmp_container)
-        rtmp_layout.setContentsMargins(0, 0, 0, 0)
-        rtmp_layout.setSpacing(4)
-
-        rtmp_label = QLabel("RTMP Порт:")
-        rtmp_label.setStyleSheet(label_style)
         self.rtmp_port_edit = QSpinBox()
         self.rtmp_port_edit.setRange(1, 65535)
         self.rtmp_port_edit.setValue(1935)
-        self.rtmp_port_edit.setStyleSheet(input_style)
         self.rtmp_port_edit.setMinimumWidth(100)
 
-        rtmp_layout.addWidget(rtmp_label)
-        rtmp_layout.addWidget(self.rtmp_port_edit)
-
-        ports_layout.addWidget(http_container)
-        ports_layout.addWidget(rtmp_container)
-        ports_layout.addStretch()
+        ports_grid.addWidget(_field_label("RTMP Порт:"), 0, 1)
+        ports_grid.addWidget(self.rtmp_port_edit, 1, 1)
+        ports_grid.setColumnStretch(2, 1)
 
-        ports_main_label = QLabel("Портууд:")
-        ports_main_label.setStyleSheet(label_style)
-        form_layout.addRow(ports_main_label, ports_widget)
+        form_layout.addRow(_field_label("Портууд:"), ports_grid)
 
         # SSL checkbox
-        security_label = QLabel("Аюулгүй Байдал:")
-        security_label.setStyleSheet(label_style)
         self.ssl_cb = QCheckBox("SSL/TLS шифрлэлт идэвхжүүлэх")
-        self.ssl_cb.setStyleSheet("""
-            QCheckBox {
-                font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
-                font-size: 11px;
-                padding: 6px;
-                color: #34495e;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border: 2px solid #bdc3c7;
-                border-radius: 3px;
-                background-color: white;
-            }
-            QCheckBox::indicator:hover {
-                border-color: #3498db;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #3498db;
-                border-color: #3498db;
-                color: white;
-            }
-        """)
-        form_layout.addRow(security_label, self.ssl_cb)
+        form_layout.addRow(_field_label("Аюулгүй Байдал:"), self.ssl_cb)
 
         content_layout.addWidget(form_group)
 
-        # Authentication group
-        auth_group = QGroupBox("Нэвтрэх Эрх (Заавал биш)")
-        auth_group.setStyleSheet(group_style)
-        auth_layout = QFormLayout(auth_group)
-        auth_layout.setVerticalSpacing(10)
-        auth_layout.setHorizontalSpacing(12)
-        auth_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+        # Authentication group - collapsed by default; its fields are built on first expand
+        self._auth_group = QGroupBox("Нэвтрэх Эрх (Заавал биш)")
+        self._auth_group.setCheckable(True)
+        self._auth_group.setChecked(False)
+        self._auth_group.toggled.connect(self._build_auth_group_contents)
+        self._auth_fields = None
+        self.username_edit = None
+        self.password_edit = None
 
-        # Username
-        username_label = QLabel("Хэрэглэгчийн Нэр:")
-        username_label.setStyleSheet(label_style)
-        self.username_edit = QLineEdit()
-        self.username_edit.setPlaceholderText("Хэрэглэгчийн нэр (шаардлагатай бол)")
-        self.username_edit.setStyleSheet(input_style)
-        auth_layout.addRow(username_label, self.username_edit)
-
-        # Password with show/hide functionality
-        password_label = QLabel("Нууц Үг:")
-        password_label.setStyleSheet(label_style)
-        
-        password_widget = QWidget()
-        password_layout = QHBoxLayout(password_widget)
-        password_layout.setContentsMargins(0, 0, 0, 0)
-        password_layout.setSpacing(6)
-        
-        self.password_edit = QLineEdit()
-        self.password_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        self.password_edit.setPlaceholderText("Нууц үг (шаардлагатай бол)")
-        self.password_edit.setStyleSheet(input_style)
-        password_layout.addWidget(self.password_edit)
-        
-        # Show/hide password button
-        show_password_btn = QPushButton("👁")
-        show_password_btn.setCheckable(True)
-        show_password_btn.setFixedSize(35, 35)
-        show_password_btn.toggled.connect(self._toggle_password_visibility)
-        show_password_btn.setStyleSheet("""
-            QPushButton {
-                border: 2px solid #ddd;
-                border-radius: 5px;
-                background-color: white;
-                font-size: 12px;
-            }
-            QPushButton:checked {
-                background-color: #3498db;
-                border-color: #3498db;
-                color: white;
-            }
-            QPushButton:hover {
-                border-color: #95a5a6;
-            }
-        """)
-        password_layout.addWidget(show_password_btn)
-        
-        auth_layout.addRow(password_label, password_widget)
-
-        content_layout.addWidget(auth_group)
+        content_layout.addWidget(self._auth_group)
 
         # Endpoints group
         endpoints_group = QGroupBox("Холболтын Цэгүүд")
-        endpoints_group.setStyleSheet(group_style)
         endpoints_layout = QFormLayout(endpoints_group)
         endpoints_layout.setVerticalSpacing(10)
         endpoints_layout.setHorizontalSpacing(12)
         endpoints_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
 
         # API Endpoint
-        api_label = QLabel("API Цэг:")
-        api_label.setStyleSheet(label_style)
         self.api_endpoint_edit = QLineEdit()
         self.api_endpoint_edit.setText("/api/v1")
-        self.api_endpoint_edit.setStyleSheet(input_style)
-        endpoints_layout.addRow(api_label, self.api_endpoint_edit)
+        endpoints_layout.addRow(_field_label("API Цэг:"), self.api_endpoint_edit)
 
         # Stream Endpoint
-        stream_label = QLabel("Стримийн Цэг:")
-        stream_label.setStyleSheet(label_style)
         self.stream_endpoint_edit = QLineEdit()
         self.stream_endpoint_edit.setText("/live")
-        self.stream_endpoint_edit.setStyleSheet(input_style)
-        endpoints_layout.addRow(stream_label, self.stream_endpoint_edit)
+        endpoints_layout.addRow(_field_label("Стримийн Цэг:"), self.stream_endpoint_edit)
 
         # Max streams
-        streams_label = QLabel("Ихдээ Стрим:")
-        streams_label.setStyleSheet(label_style)
         self.max_streams_edit = QSpinBox()
         self.max_streams_edit.setRange(1, 100)
         self.max_streams_edit.setValue(10)
-        self.max_streams_edit.setStyleSheet(input_style)
         self.max_streams_edit.setMinimumWidth(100)
-        endpoints_layout.addRow(streams_label, self.max_streams_edit)
+        endpoints_layout.addRow(_field_label("Ихдээ Стрим:"), self.max_streams_edit)
 
         # Description - expandable text area
-        description_label = QLabel("Тайлбар:")
-        description_label.setStyleSheet(label_style)
         self.description_edit = QTextEdit()
         self.description_edit.setMaximumHeight(70)
         self.description_edit.setMinimumHeight(50)
         self.description_edit.setPlaceholderText("Серверийн тухай нэмэлт мэдээлэл...")
-        self.description_edit.setStyleSheet(input_style + """
-            QTextEdit {
-                line-height: 1.3;
-            }
-        """)
-        endpoints_layout.addRow(description_label, self.description_edit)
+        endpoints_layout.addRow(_field_label("Тайлбар:"), self.description_edit)
 
         content_layout.addWidget(endpoints_group)
 
         # URL Preview group
         preview_group = QGroupBox("URL Урьдчилан Үзэх")
-        preview_group.setStyleSheet(group_style)
         preview_layout = QFormLayout(preview_group)
         preview_layout.setVerticalSpacing(8)
         preview_layout.setHorizontalSpacing(12)
@@ -572,55 +886,22 @@ class ServerEditDialog(QDialog):
 
         # Info label
         info_label = QLabel("💡 URL дээр дарж хуулна уу")
-        info_label.setStyleSheet("""
-            QLabel {
-                font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
-                color: #7f8c8d;
-                font-style: italic;
-                font-size: 10px;
-                margin-bottom: 6px;
-            }
-        """)
+        info_label.setObjectName("previewHint")
         preview_layout.addRow("", info_label)
 
-        # URL styling
-        url_style = """
-            QLabel {
-                font-family: 'Consolas', 'Courier New', monospace;
-                font-size: 10px;
-                color: #2c3e50;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ffffff, stop:1 #f8f9fa);
-                padding: 8px 10px;
-                border-radius: 5px;
-                border: 2px solid #e9ecef;
-                min-height: 14px;
-                word-wrap: break-word;
-            }
-            QLabel:hover {
-                border-color: #3498db;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #f8f9fa, stop:1 #e9ecef);
-            }
-        """
-
         # RTMP URL
-        rtmp_label = QLabel("RTMP Хаяг:")
-        rtmp_label.setStyleSheet(label_style)
-        self.rtmp_url_label = QLabel("rtmp://localhost:1935/live")
-        self.rtmp_url_label.setStyleSheet(url_style)
+        self.rtmp_url_label = ClickableLabel("rtmp://localhost:1935/live")
+        self.rtmp_url_label.setProperty("role", "url")
         self.rtmp_url_label.setCursor(Qt.CursorShape.PointingHandCursor)
         self.rtmp_url_label.setWordWrap(True)
-        preview_layout.addRow(rtmp_label, self.rtmp_url_label)
+        preview_layout.addRow(_field_label("RTMP Хаяг:"), self.rtmp_url_label)
 
         # API URL
-        api_url_label = QLabel("API Хаяг:")
-        api_url_label.setStyleSheet(label_style)
-        self.api_url_label = QLabel("http://localhost:8080/api/v1")
-        self.api_url_label.setStyleSheet(url_style)
+        self.api_url_label = ClickableLabel("http://localhost:8080/api/v1")
+        self.api_url_label.setProperty("role", "url")
         self.api_url_label.setCursor(Qt.CursorShape.PointingHandCursor)
         self.api_url_label.setWordWrap(True)
-        preview_layout.addRow(api_url_label, self.api_url_label)
+        preview_layout.addRow(_field_label("API Хаяг:"), self.api_url_label)
 
         content_layout.addWidget(preview_group)
 
@@ -630,37 +911,29 @@ class ServerEditDialog(QDialog):
         # Add stretch to push content to top
         content_layout.addStretch()
 
-        # Set scroll area content
-        scroll_area.setWidget(content_widget)
-        main_layout.addWidget(scroll_area)
-
-        # Connect signals for live preview
-        self.host_edit.textChanged.connect(self._update_preview)
-        self.port_edit.valueChanged.connect(self._update_preview)
-        self.rtmp_port_edit.valueChanged.connect(self._update_preview)
-        self.ssl_cb.toggled.connect(self._update_preview)
-        self.api_endpoint_edit.textChanged.connect(self._update_preview)
-        self.stream_endpoint_edit.textChanged.connect(self._update_preview)
-
-        # Button styling
-        button_style_base = """
-            QPushButton {
-                font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
-                font-size: 11px;
-                font-weight: bold;
-                padding: 8px 16px;
-                border-radius: 5px;
-                border: none;
-                min-width: 80px;
-                min-height: 32px;
-            }
-            QPushButton:hover {
-                transform: translateY(-1px);
-            }
-            QPushButton:pressed {
-                transform: translateY(1px);
-            }
-        """
+        # Only wrap the content in a scroll area when the screen is too short to show it all
+        screen = QApplication.primaryScreen()
+        if screen is not None and screen.availableGeometry().height() >= 900:
+            main_layout.addWidget(content_widget)
+        else:
+            scroll_area = QScrollArea()
+            scroll_area.setWidgetResizable(True)
+            scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+            scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+            scroll_area.setWidget(content_widget)
+            main_layout.addWidget(scroll_area)
+
+        # Connect signals for live preview; queued so the keystroke returns to the event loop first
+        preview_signals = (
+            self.host_edit.textChanged,
+            self.port_edit.valueChanged,
+            self.rtmp_port_edit.valueChanged,
+            self.ssl_cb.toggled,
+            self.api_endpoint_edit.textChanged,
+            self.stream_endpoint_edit.textChanged,
+        )
+        for signal in preview_signals:
+            signal.connect(self._schedule_preview, Qt.ConnectionType.QueuedConnection)
 
         # Button layout
         button_layout = QHBoxLayout()
@@ -669,56 +942,26 @@ class ServerEditDialog(QDialog):
 
         # Test connection button
         test_btn = QPushButton("🧪 Холболт Шалгах")
+        test_btn.setObjectName("testButton")
+        test_btn.setProperty("role", "action")
         test_btn.clicked.connect(self._test_connection)
-        test_btn.setStyleSheet(button_style_base + """
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3498db, stop:1 #2980b9);
-                color: white;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #2980b9, stop:1 #21618c);
-            }
-        """)
         button_layout.addWidget(test_btn)
 
         button_layout.addStretch()
 
         # Cancel button
         cancel_btn = QPushButton("Цуцлах")
+        cancel_btn.setObjectName("cancelButton")
+        cancel_btn.setProperty("role", "action")
         cancel_btn.clicked.connect(self.reject)
-        cancel_btn.setStyleSheet(button_style_base + """
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #95a5a6, stop:1 #7f8c8d);
-                color: white;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #7f8c8d, stop:1 #6c7b7d);
-            }
-        """)
         button_layout.addWidget(cancel_btn)
 
         # Save button
         save_btn = QPushButton("Хадгалах")
+        save_btn.setObjectName("saveButton")
+        save_btn.setProperty("role", "action")
         save_btn.clicked.connect(self._save_server)
         save_btn.setDefault(True)
-        save_btn.setStyleSheet(button_style_base + """
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #27ae60, stop:1 #229954);
-                color: white;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #229954, stop:1 #1e7e34);
-                }
-            QPushButton:default {
-                border: 2px solid #ffffff;
-            }
-        """)
         button_layout.addWidget(save_btn)
 
         main_layout.addLayout(button_layout)
@@ -729,10 +972,50 @@ class ServerEditDialog(QDialog):
         # Initial preview update
         self._update_preview()
 
-    def resizeEvent(self, event):
-        """Handle window resize events"""
-        super().resizeEvent(event)
-        self.update()
+    def _build_auth_group_contents(self, checked: bool):
+        """Create the username/password fields on first expand; show them only while checked"""
+        if self._auth_fields is not None:
+            # Unchecking only greys the fields out; hide them so nothing unsaved stays on screen
+            self._auth_fields.setVisible(checked)
+            return
+        if not checked:
+            return
+
+        self._auth_fields = QWidget()
+        group_layout = QVBoxLayout(self._auth_group)
+        group_layout.setContentsMargins(0, 0, 0, 0)
+        group_layout.addWidget(self._auth_fields)
+
+        auth_layout = QFormLayout(self._auth_fields)
+        auth_layout.setVerticalSpacing(10)
+        auth_layout.setHorizontalSpacing(12)
+        auth_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
+
+        # Username
+        self.username_edit = QLineEdit()
+        self.username_edit.setPlaceholderText("Хэрэглэгчийн нэр (шаардлагатай бол)")
+        auth_layout.addRow(_field_label("Хэрэглэгчийн Нэр:"), self.username_edit)
+
+        # Password with show/hide functionality
+        password_widget = QWidget()
+        password_layout = QHBoxLayout(password_widget)
+        password_layout.setContentsMargins(0, 0, 0, 0)
+        password_layout.setSpacing(6)
+        
+        self.password_edit = QLineEdit()
+        self.password_edit.setEchoMode(QLineEdit.EchoMode.Password)
+        self.password_edit.setPlaceholderText("Нууц үг (шаардлагатай бол)")
+        password_layout.addWidget(self.password_edit)
+        
+        # Show/hide password button
+        show_password_btn = QPushButton("👁")
+        show_password_btn.setObjectName("passwordToggle")
+        show_password_btn.setCheckable(True)
+        show_password_btn.setFixedSize(35, 35)
+        show_password_btn.toggled.connect(self._toggle_password_visibility)
+        password_layout.addWidget(show_password_btn)
+        
+        auth_layout.addRow(_field_label("Нууц Үг:"), password_widget)
 
     def _toggle_password_visibility(self, checked):
         """Toggle password field visibility"""
@@ -743,124 +1026,92 @@ class ServerEditDialog(QDialog):
 
     def _copy_to_clipboard(self, text, label="URL"):
         """Copy text to clipboard with visual feedback"""
-        clipboard = QApplication.clipboard()
-        clipboard.setText(text)
+        self._clipboard.setText(text)
         
         QToolTip.showText(
             QCursor.pos(), 
             f"{label} хуулагдлаа!", 
             None,
-            QRect(),
+            self._empty_rect,
             2000
         )
 
     def _setup_url_click_handlers(self):
         """Setup click handlers for URL labels"""
-        def rtmp_click_handler(event):
-            if event.button() == Qt.MouseButton.LeftButton:
-                self._copy_to_clipboard(self.rtmp_url_label.text(), "RTMP URL")
-        
-        def api_click_handler(event):
-            if event.button() == Qt.MouseButton.LeftButton:
-                self._copy_to_clipboard(self.api_url_label.text(), "API URL")
-        
-        self.rtmp_url_label.mousePressEvent = rtmp_click_handler
-        self.api_url_label.mousePressEvent = api_click_handler
+        self.rtmp_url_label.clicked.connect(functools.partial(self._copy_to_clipboard, label="RTMP URL"))
+        self.api_url_label.clicked.connect(functools.partial(self._copy_to_clipboard, label="API URL"))
 
     def _populate_fields(self):
         """Populate fields with existing server config"""
         if not self.server_config:
             return
 
+        # Load all fields with signals blocked, then refresh the preview once
+        blockers = [QSignalBlocker(widget) for widget in (
+            self.name_edit, self.host_edit, self.port_edit, self.rtmp_port_edit,
+            self.ssl_cb, self.api_endpoint_edit, self.stream_endpoint_edit,
+            self.max_streams_edit, self.description_edit
+        )]
+
         self.name_edit.setText(self.server_config.name)
         self.host_edit.setText(self.server_config.host)
         self.port_edit.setValue(self.server_config.port)
         self.rtmp_port_edit.setValue(self.server_config.rtmp_port)
         self.ssl_cb.setChecked(self.server_config.ssl_enabled)
-        self.username_edit.setText(self.server_config.username or "")
-        self.password_edit.setText(self.server_config.password or "")
+        if self.server_config.username or self.server_config.password:
+            self._auth_group.setChecked(True)
+            self.username_edit.setText(self.server_config.username or "")
+            self.password_edit.setText(self.server_config.password or "")
         self.api_endpoint_edit.setText(self.server_config.api_endpoint)
         self.stream_endpoint_edit.setText(self.server_config.stream_endpoint)
         self.max_streams_edit.setValue(self.server_config.max_streams)
         self.description_edit.setPlainText(self.server_config.description)
 
+        for blocker in blockers:
+            blocker.unblock()
+        self._preview_timer.stop()
+        self._update_preview()
+
+    def _schedule_preview(self, *_):
+        """Restart the debounce timer for the URL preview"""
+        self._preview_timer.start()
+
     def _update_preview(self):
         """Update URL preview"""
         try:
-            host = self.host_edit.text().strip() or "localhost"
-            port = self.port_edit.value()
-            rtmp_port = self.rtmp_port_edit.value()
-            ssl = self.ssl_cb.isChecked()
-            api_endpoint = self.api_endpoint_edit.text().strip() or "/api/v1"
-            stream_endpoint = self.stream_endpoint_edit.text().strip() or "/live"
+            # Compare the raw widget values first; strip/default only when something changed
+            key = (
+                self.host_edit.text(), self.port_edit.value(), self.rtmp_port_edit.value(),
+                self.ssl_cb.isChecked(), self.api_endpoint_edit.text(), self.stream_endpoint_edit.text()
+            )
+            if key == self._last_preview_key:
+                return
             
-            clean_host = self._clean_host_url(host)
+            raw_host, port, rtmp_port, ssl, raw_api, raw_stream = key
+            host = raw_host.strip() or "localhost"
+            api_endpoint = raw_api.strip() or "/api/v1"
+            stream_endpoint = raw_stream.strip() or "/live"
             
-            rtmp_protocol = "rtmps" if ssl else "rtmp"
-            rtmp_url = f"{rtmp_protocol}://{clean_host}:{rtmp_port}{stream_endpoint}"
-            self.rtmp_url_label.setText(rtmp_url)
+            clean_host = _clean_host_url(host)
             
-            api_protocol = "https" if ssl else "http"
-            api_url = f"{api_protocol}://{clean_host}:{port}{api_endpoint}"
-            self.api_url_label.setText(api_url)
+            rtmp_url = _RTMP_PROTOCOLS[ssl] + "://" + clean_host + ":" + str(rtmp_port) + stream_endpoint
+            if rtmp_url != self._last_rtmp_url:
+                self.rtmp_url_label.setText(rtmp_url)
+                self._last_rtmp_url = rtmp_url
             
-        except Exception:
-            self.rtmp_url_label.setText("rtmp://localhost:1935/live")
-            self.api_url_label.setText("http://localhost:8080/api/v1")
-
-    def _clean_host_url(self, host: str) -> str:
-        """Clean and validate host URL"""
-        if not host or host.isspace():
-            return "localhost"
-        
-        host = host.strip()
-        
-        if "://" in host:
-            host = host.split("://", 1)[1]
-        
-        if "/" in host:
-            host = host.split("/")[0]
-        
-        if host.lower() in ["localhost", "127.0.0.1", "::1"]:
-            return "localhost"
-        
-        try:
-            import re
-            cleaned = re.sub(r'[^a-zA-Z0-9.\-_:]', '', host)
+            api_url = _HTTP_PROTOCOLS[ssl] + "://" + clean_host + ":" + str(port) + api_endpoint
+            if api_url != self._last_api_url:
+                self.api_url_label.setText(api_url)
+                self._last_api_url = api_url
             
-            if not cleaned:
-                return "localhost"
+            self._last_preview_key = key
             
-            if self._is_valid_host_format(cleaned):
-                return cleaned
-            else:
-                return "localhost"
-                
         except Exception:
-            return "localhost"
-
-    def _is_valid_host_format(self, host: str) -> bool:
-        """Check if host format is valid"""
-        if not host:
-            return False
-        
-        if host.lower() == "localhost":
-            return True
-        
-        import re
-        
-        patterns = [
-            r'^[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)*$',
-            r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$',
-            r'^[0-9a-fA-F:]+$',
-            r'^[a-zA-Z0-9._-]+$'
-        ]
-        
-        for pattern in patterns:
-            if re.match(pattern, host):
-                return True
-        
-        return False
+            self._last_preview_key = None
+            self._last_rtmp_url = "rtmp://localhost:1935/live"
+            self._last_api_url = "http://localhost:8080/api/v1"
+            self.rtmp_url_label.setText(self._last_rtmp_url)
+            self.api_url_label.setText(self._last_api_url)
 
     def _test_connection(self):
         """Test server connection"""
@@ -869,169 +1120,106 @@ class ServerEditDialog(QDialog):
             if not config:
                 return
             
-            test_dialog = QDialog(self)
-            test_dialog.setWindowTitle("Холболтын Шалгалт")
-            test_dialog.setModal(True)
-            test_dialog.resize(550, 500)
-            test_dialog.setStyleSheet("""
-                QDialog {
-                    background-color: #f8f9fa;
-                    font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
-                }
-            """)
-            
-            layout = QVBoxLayout(test_dialog)
-            layout.setSpacing(15)
-            layout.setContentsMargins(20, 20, 20, 20)
-            
-            header = QLabel("🔍 Серверийн Тохиргооны Шалгалт")
-            header.setStyleSheet("""
-                QLabel {
-                    font-size: 16px;
-                    font-weight: bold;
-                    color: #2c3e50;
-                    padding: 12px;
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #ecf0f1, stop:1 #bdc3c7);
-                    border-radius: 6px;
-                    text-align: center;
-                }
-            """)
-            header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(header)
-            
-            scroll_area = QScrollArea()
-            scroll_area.setWidgetResizable(True)
-            scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-            scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-            
-            content_widget = QWidget()
-            content_layout = QVBoxLayout(content_widget)
-            content_layout.setContentsMargins(15, 15, 15, 15)
-            content_layout.setSpacing(12)
-            
-            results_text = f"""
-            <div style="font-family: 'Segoe UI', sans-serif; line-height: 1.5; font-size: 12px;">
-            <h3 style="color: #27ae60; margin-bottom: 12px;">✅ Тохиргоо Зөв</h3>
-            
-            <h4 style="color: #34495e; margin-bottom: 8px;">Серверийн Мэдээлэл:</h4>
-            <table style="width: 100%; border-collapse: collapse; margin-bottom: 12px; border: 1px solid #ddd;">
-            <tr><td style="padding: 8px; font-weight: bold; background: #ecf0f1; border: 1px solid #ddd; width: 40%;">Нэр:</td><td style="padding: 8px; background: #f8f9fa; border: 1px solid #ddd;">{config.name}</td></tr>
-            <tr><td style="padding: 8px; font-weight: bold; background: #ecf0f1; border: 1px solid #ddd;">Хост:</td><td style="padding: 8px; background: #f8f9fa; border: 1px solid #ddd;">{config.host}</td></tr>
-            <tr><td style="padding: 8px; font-weight: bold; background: #ecf0f1; border: 1px solid #ddd;">HTTP Порт:</td><td style="padding: 8px; background: #f8f9fa; border: 1px solid #ddd;">{config.port}</td></tr>
-            <tr><td style="padding: 8px; font-weight: bold; background: #ecf0f1; border: 1px solid #ddd;">RTMP Порт:</td><td style="padding: 8px; background: #f8f9fa; border: 1px solid #ddd;">{config.rtmp_port}</td></tr>
-            <tr><td style="padding: 8px; font-weight: bold; background: #ecf0f1; border: 1px solid #ddd;">SSL:</td><td style="padding: 8px; background: #f8f9fa; border: 1px solid #ddd;">{'🔒 Идэвхтэй' if config.ssl_enabled else '🔓 Идэвхгүй'}</td></tr>
-            </table>
-            
-            <h4 style="color: #34495e; margin-bottom: 8px;">Үүссэн URL Хаягууд:</h4>
-            <div style="background: #e8f5e8; padding: 10px; border-radius: 6px; margin: 6px 0; border-left: 3px solid #27ae60;">
-            <strong>RTMP URL:</strong><br/>
-            <code style="background: #ffffff; padding: 4px; border-radius: 3px; font-family: 'Consolas', monospace; word-break: break-all; display: block; margin-top: 4px;">{config.rtmp_url}</code>
-            </div>
-            
-            <div style="background: #e3f2fd; padding: 10px; border-radius: 6px; margin: 6px 0; border-left: 3px solid #2196f3;">
-            <strong>API URL:</strong><br/>
-            <code style="background: #ffffff; padding: 4px; border-radius: 3px; font-family: 'Consolas', monospace; word-break: break-all; display: block; margin-top: 4px;">{config.api_url}</code>
-            </div>
-            </div>"""
+            # Built on first use and reused for later clicks
+            if self._test_dialog is None:
+                self._test_dialog = self._build_test_dialog()
             
-            results_label = QLabel(results_text)
-            results_label.setWordWrap(True)
-            results_label.setTextFormat(Qt.TextFormat.RichText)
-            results_label.setAlignment(Qt.AlignmentFlag.AlignTop)
+            # Resolve the URLs once; the report and the copy buttons share the strings
+            self._test_rtmp_url = config.rtmp_url
+            self._test_api_url = config.api_url
+            self._test_results_label.setText(_TEST_HTML_TEMPLATE.format(
+                name=config.name,
+                host=config.host,
+                port=config.port,
+                rtmp_port=config.rtmp_port,
+                ssl_str='🔒 Идэвхтэй' if config.ssl_enabled else '🔓 Идэвхгүй',
+                rtmp_url=self._test_rtmp_url,
+                api_url=self._test_api_url
+            ))
             
-            content_layout.addWidget(results_label)
-            content_layout.addStretch()
-            
-            scroll_area.setWidget(content_widget)
-            layout.addWidget(scroll_area)
-            
-            button_layout = QHBoxLayout()
-            button_layout.setSpacing(8)
-            
-            copy_rtmp_btn = QPushButton("📋 RTMP Хуулах")
-            copy_rtmp_btn.clicked.connect(lambda: self._copy_to_clipboard(config.rtmp_url, "RTMP URL"))
-            copy_rtmp_btn.setStyleSheet("""
-                QPushButton {
-                    font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #3498db, stop:1 #2980b9);
-                    color: white;
-                    font-weight: bold;
-                    padding: 8px 16px;
-                    border-radius: 5px;
-                    border: none;
-                    min-height: 30px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #2980b9, stop:1 #21618c);
-                }
-            """)
-            button_layout.addWidget(copy_rtmp_btn)
-            
-            copy_api_btn = QPushButton("📋 API Хуулах")
-            copy_api_btn.clicked.connect(lambda: self._copy_to_clipboard(config.api_url, "API URL"))
-            copy_api_btn.setStyleSheet("""
-                QPushButton {
-                    font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #9b59b6, stop:1 #8e44ad);
-                    color: white;
-                    font-weight: bold;
-                    padding: 8px 16px;
-                    border-radius: 5px;
-                    border: none;
-                    min-height: 30px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #8e44ad, stop:1 #7d3c98);
-                }
-            """)
-            button_layout.addWidget(copy_api_btn)
-            
-            button_layout.addStretch()
-            
-            close_btn = QPushButton("Хаах")
-            close_btn.clicked.connect(test_dialog.accept)
-            close_btn.setDefault(True)
-            close_btn.setStyleSheet("""
-                QPushButton {
-                    font-family: 'Segoe UI', 'Arial Unicode MS', sans-serif;
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #27ae60, stop:1 #229954);
-                    color: white;
-                    font-weight: bold;
-                    padding: 8px 20px;
-                    border-radius: 5px;
-                    border: none;
-                    min-width: 70px;
-                    min-height: 30px;
-                }
-                QPushButton:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #229954, stop:1 #1e7e34);
-                }
-                QPushButton:default {
-                    border: 2px solid #ffffff;
-                }
-            """)
-            button_layout.addWidget(close_btn)
-            
-            layout.addLayout(button_layout)
-            
-            test_dialog.exec()
+            self._test_dialog.exec()
             
         except ValueError as e:
             QMessageBox.warning(self, "Тохиргооны Алдаа", str(e))
         except Exception as e:
-            error_dialog = QMessageBox(self)
-            error_dialog.setIcon(QMessageBox.Icon.Warning)
-            error_dialog.setWindowTitle("Тохиргооны Алдаа")
-            error_dialog.setText("Серверийн тохиргоо баталгаажуулахад алдаа гарлаа")
-            error_dialog.setDetailedText(f"Алдааны дэлгэрэнгүй:\n{str(e)}")
-            error_dialog.exec()
+            QMessageBox.warning(self, "Тохиргооны Алдаа", f"Серверийн тохиргоо баталгаажуулахад алдаа гарлаа\n{e}")
+
+    def _build_test_dialog(self) -> QDialog:
+        """Build the connection test dialog once; its report label is refilled per test"""
+        test_dialog = QDialog(self)
+        test_dialog.setWindowTitle("Холболтын Шалгалт")
+        test_dialog.setModal(True)
+        # Fixed size: the report scrolls, so Qt never needs to renegotiate the geometry
+        test_dialog.setFixedSize(550, 500)
+        test_dialog.setStyleSheet(_TEST_DIALOG_QSS)
+        
+        layout = QVBoxLayout(test_dialog)
+        layout.setSpacing(15)
+        layout.setContentsMargins(20, 20, 20, 20)
+        
+        header = QLabel("🔍 Серверийн Тохиргооны Шалгалт")
+        header.setObjectName("testHeader")
+        header.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(header)
+        
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        
+        content_widget = QWidget()
+        content_layout = QVBoxLayout(content_widget)
+        content_layout.setContentsMargins(15, 15, 15, 15)
+        content_layout.setSpacing(12)
+        
+        self._test_results_label = QLabel()
+        self._test_results_label.setWordWrap(True)
+        self._test_results_label.setTextFormat(Qt.TextFormat.RichText)
+        self._test_results_label.setAlignment(Qt.AlignmentFlag.AlignTop)
+        
+        content_layout.addWidget(self._test_results_label)
+        content_layout.addStretch()
+        
+        scroll_area.setWidget(content_widget)
+        layout.addWidget(scroll_area)
+        
+        # Only the default Close button is built up front; the copy buttons are
+        # added once the dialog's event loop is running so it paints first
+        self._test_button_layout = QHBoxLayout()
+        button_layout = self._test_button_layout
+        button_layout.setSpacing(8)
+        button_layout.addStretch()
+        
+        close_btn = QPushButton("Хаах")
+        close_btn.clicked.connect(test_dialog.accept)
+        close_btn.setDefault(True)
+        close_btn.setObjectName("closeBtn")
+        button_layout.addWidget(close_btn)
+        
+        layout.addLayout(button_layout)
+        
+        QTimer.singleShot(0, self._populate_test_buttons)
+        return test_dialog
+
+    def _populate_test_buttons(self):
+        """Add the copy buttons to the connection test dialog, ahead of the stretch"""
+        copy_rtmp_btn = QPushButton("📋 RTMP Хуулах")
+        copy_rtmp_btn.clicked.connect(self._copy_test_rtmp_url)
+        copy_rtmp_btn.setObjectName("copyRtmpBtn")
+        self._test_button_layout.insertWidget(0, copy_rtmp_btn)
+        
+        copy_api_btn = QPushButton("📋 API Хуулах")
+        copy_api_btn.clicked.connect(self._copy_test_api_url)
+        copy_api_btn.setObjectName("copyApiBtn")
+        self._test_button_layout.insertWidget(1, copy_api_btn)
+
+    def _copy_test_rtmp_url(self):
+        """Copy the RTMP URL from the last connection test"""
+        self._copy_to_clipboard(self._test_rtmp_url, "RTMP URL")
+
+    def _copy_test_api_url(self):
+        """Copy the API URL from the last connection test"""
+        self._copy_to_clipboard(self._test_api_url, "API URL")
 
     def _create_server_config(self):
         """Create server configuration from form"""
@@ -1044,24 +1232,32 @@ class ServerEditDialog(QDialog):
         if not host_input:
             raise ValueError("Хост хаяг шаардлагатай")
         
-        clean_host = self._clean_host_url(host_input)
+        clean_host = _clean_host_url(host_input)
         
         if clean_host == "localhost" and host_input.lower() != "localhost":
-            reply = QMessageBox.question(
-                self,
-                "Хост Хаяг Анхааруулга",
-                f"Оруулсан хост хаяг '{host_input}' нь 'localhost' болж өөрчлөгдөнө.\n\nҮргэлжлүүлэх үү?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No
-            )
+            # Built on first use and reused; only the message text changes
+            if self._localhost_warning_box is None:
+                box = QMessageBox(self)
+                box.setIcon(QMessageBox.Icon.Question)
+                box.setWindowTitle("Хост Хаяг Анхааруулга")
+                box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+                box.setDefaultButton(QMessageBox.StandardButton.No)
+                self._localhost_warning_box = box
             
-            if reply == QMessageBox.StandardButton.No:
+            box = self._localhost_warning_box
+            box.setText(f"Оруулсан хост хаяг '{host_input}' нь 'localhost' болж өөрчлөгдөнө.\n\nҮргэлжлүүлэх үү?")
+            box.exec()
+            
+            if box.standardButton(box.clickedButton()) != QMessageBox.StandardButton.Yes:
                 self.host_edit.setFocus()
                 self.host_edit.selectAll()
                 raise ValueError("Хост хаягийг шалгаж засна уу")
         
-        username = self.username_edit.text().strip() or None
-        password = self.password_edit.text().strip() or None
+        # A collapsed (or never expanded) authentication group means no credentials
+        username = password = None
+        if self._auth_group.isChecked() and self.username_edit is not None:
+            username = _text_or_none(self.username_edit)
+            password = _text_or_none(self.password_edit)
         
         return ServerConfig(
             name=name,
@@ -1096,11 +1292,128 @@ class ServerEditDialog(QDialog):
 # MAIN SERVER MANAGER DIALOG - STANDARDIZED SIZE
 # =============================================================================
 
+# Set once on the manager dialog; widgets opt in through their objectName or "role" property.
+# Child dialogs (edit, message boxes) inherit it, so names must not clash with _EDIT_DIALOG_QSS
+_MANAGER_DIALOG_QSS = """
+    QLabel#managerHeader {
+        font-size: 20px;
+        font-weight: bold;
+        padding: 15px;
+        background-color: #2c3e50;
+        color: white;
+        border-radius: 6px;
+        margin-bottom: 15px;
+    }
+    QLabel#fileInfo {
+        color: #7f8c8d;
+        font-size: 9px;
+        font-style: italic;
+    }
+    QSplitter::handle {
+        background-color: #bdc3c7;
+    }
+    QGroupBox {
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QGroupBox::title {
+        color: #34495e;
+        padding: 3px 0;
+    }
+    QGroupBox#descGroup {
+        margin-top: 12px;
+        font-size: 11px;
+    }
+    QListWidget {
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        padding: 4px;
+        background-color: #ecf0f1;
+        font-size: 11px;
+    }
+    QListWidget::item {
+        padding: 6px;
+        border-bottom: 1px solid #e0e0e0;
+    }
+    QListWidget::item:last {
+        border-bottom: none;
+    }
+    QListWidget::item:selected {
+        background-color: #3498db;
+        color: white;
+        border-radius: 2px;
+    }
+    QListWidget::item:hover {
+        background-color: #dfe6e9;
+    }
+    QLabel#detailName {
+        font-weight: bold;
+        font-size: 14px;
+        color: #2c3e50;
+    }
+    QLabel[role="detail"] {
+        color: #34495e;
+        font-size: 11px;
+    }
+    QLabel[role="detailUrl"] {
+        color: #2c3e50;
+        font-family: monospace;
+        font-size: 10px;
+        background-color: #ecf0f1;
+        padding: 4px;
+        border-radius: 3px;
+        border: 1px solid #ccc;
+    }
+    QLabel#detailDescription {
+        color: #333;
+        padding: 8px;
+        background-color: #f9f9f9;
+        border: 1px dashed #ddd;
+        border-radius: 3px;
+        font-size: 10px;
+    }
+    QLabel#detailDescription[empty="true"] {
+        color: #666;
+        font-style: italic;
+    }
+    QPushButton[role="managerAction"] {
+        color: white;
+        font-weight: bold;
+        padding: 6px 12px;
+        border-radius: 3px;
+        border: none;
+        font-size: 10px;
+    }
+    QPushButton[role="managerAction"]:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+    QPushButton#defaultsButton { background-color: #f39c12; }
+    QPushButton#defaultsButton:hover { background-color: #e67e22; }
+    QPushButton#exportButton { background-color: #2980b9; }
+    QPushButton#exportButton:hover { background-color: #2471a3; }
+    QPushButton#importButton { background-color: #8e44ad; }
+    QPushButton#importButton:hover { background-color: #7d3c98; }
+    QPushButton#closeManagerButton { background-color: #7f8c8d; padding: 6px 16px; }
+    QPushButton#closeManagerButton:hover { background-color: #616e70; }
+    QPushButton#addButton { background-color: #27ae60; }
+    QPushButton#addButton:hover { background-color: #229a54; }
+    QPushButton#editButton, QPushButton#testServerButton { background-color: #3498db; }
+    QPushButton#editButton:hover, QPushButton#testServerButton:hover { background-color: #2980b9; }
+    QPushButton#deleteButton { background-color: #e74c3c; }
+    QPushButton#deleteButton:hover { background-color: #c0392b; }
+    QPushButton#copyRtmpButton { background-color: #95a5a6; }
+    QPushButton#copyRtmpButton:hover { background-color: #7f8c8d; }
+"""
+
+
 class ServerManagerDialog(QDialog):
     """Main dialog for managing streaming servers with standardized size"""
 
     # Signal for auto-update
     servers_changed = pyqtSignal()
+    # Emitted from the thread pool when a connection test finishes: (success, message)
+    _probe_finished = pyqtSignal(bool, str)
 
     def __init__(self, config_manager=None, parent=None):
         super().__init__(parent)
@@ -1114,10 +1427,33 @@ class ServerManagerDialog(QDialog):
 
         # Connect storage manager signals for auto-update
         self.storage_manager.servers_changed.connect(self.servers_changed.emit)
+        
+        # Reused by the copy button instead of being looked up/constructed per click
+        self._clipboard = QApplication.clipboard()
+        self._empty_rect = QRect()
+        
+        # Next numeric suffix to try per key base, so repeated collisions don't rescan from _1
+        self._key_suffix: Dict[str, int] = {}
+        
+        # Connection tests run off the GUI thread; one at a time
+        self._probe_running = False
+        self._probe_finished.connect(self._on_probe_done)
 
         # Load servers from file
         self.servers: Dict[str, ServerConfig] = {}
         self._load_servers()
+        # Config file version the list was built from; a reused dialog reloads on show when it differs
+        self._loaded_version = self.storage_manager.file_version()
+        
+        # Follow edits made to the config file by other processes while the dialog is open;
+        # the short delay rides out write-then-rename saves
+        self._config_path = str(self.storage_manager.config_file)
+        self._watcher = QFileSystemWatcher([self._config_path], self)
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(200)
+        self._reload_timer.timeout.connect(self._on_config_file_changed)
+        self._watcher.fileChanged.connect(self._reload_timer.start)
 
         self.setWindowTitle("🖥️ Сервер Удирдах")
         self.setModal(True)
@@ -1130,35 +1466,54 @@ class ServerManagerDialog(QDialog):
         self._init_ui()
         self._populate_servers()
 
+    def showEvent(self, event):
+        """Reload the servers if the config file changed while the dialog was hidden"""
+        super().showEvent(event)
+        self._reload_if_changed()
+
+    def _reload_if_changed(self):
+        """Reload and repopulate only when the config file changed since the last load"""
+        version = self.storage_manager.file_version()
+        if self.storage_manager.is_current(version):
+            # Written by our own storage manager; the list was already updated in place
+            self._loaded_version = version
+        elif version != self._loaded_version:
+            self._load_servers()
+            self._loaded_version = self.storage_manager.file_version()
+            self._populate_servers()
+
+    def _on_config_file_changed(self):
+        """Debounced QFileSystemWatcher handler"""
+        # Atomic saves replace the file, which drops it from the watcher
+        if self._config_path not in self._watcher.files():
+            self._watcher.addPath(self._config_path)
+        
+        # A hidden dialog catches up in showEvent instead
+        if self.isVisible():
+            self._reload_if_changed()
+
     def _init_ui(self):
         """Initialize dialog UI with standardized styling"""
+        self.setStyleSheet(_MANAGER_DIALOG_QSS)
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 15, 15, 15)
         layout.setSpacing(12)
 
         # Header - СТАНДАРТ ХЭМЖЭЭ
         header_label = QLabel("📡 Стриминг Сервер Удирдах")
-        header_label.setStyleSheet("""
-            font-size: 20px;
-            font-weight: bold;
-            padding: 15px;
-            background-color: #2c3e50;
-            color: white;
-            border-radius: 6px;
-            margin-bottom: 15px;
-        """)
+        header_label.setObjectName("managerHeader")
         header_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(header_label)
 
         # File info
-        file_info_label = QLabel(f"📁 Тохиргооны файл: {self.storage_manager.config_file}")
-        file_info_label.setStyleSheet("color: #7f8c8d; font-size: 9px; font-style: italic;")
+        file_info_label = QLabel(f"📁 Тохиргооны файл: {self._config_path}")
+        file_info_label.setObjectName("fileInfo")
         layout.addWidget(file_info_label)
 
         # Main content
         content_splitter = QSplitter(Qt.Orientation.Horizontal)
         content_splitter.setHandleWidth(2)
-        content_splitter.setStyleSheet("QSplitter::handle { background-color: #bdc3c7; }")
 
         # Left panel - Server list
         left_panel = self._create_server_list_panel()
@@ -1177,56 +1532,20 @@ class ServerManagerDialog(QDialog):
 
         defaults_btn = QPushButton("🔄 Үндсэн Тохиргоог Ачаалах")
         defaults_btn.clicked.connect(self._load_default_servers)
-        defaults_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f39c12;
-                color: white;
-                font-weight: bold;
-                padding: 6px 12px;
-                border-radius: 3px;
-                border: none;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #e67e22;
-            }
-        """)
+        defaults_btn.setObjectName("defaultsButton")
+        defaults_btn.setProperty("role", "managerAction")
         button_layout.addWidget(defaults_btn)
 
         export_btn = QPushButton("📤 Экспорт")
         export_btn.clicked.connect(self._export_servers)
-        export_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2980b9;
-                color: white;
-                font-weight: bold;
-                padding: 6px 12px;
-                border-radius: 3px;
-                border: none;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #2471a3;
-            }
-        """)
+        export_btn.setObjectName("exportButton")
+        export_btn.setProperty("role", "managerAction")
         button_layout.addWidget(export_btn)
 
         import_btn = QPushButton("📥 Импорт")
         import_btn.clicked.connect(self._import_servers)
-        import_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #8e44ad;
-                color: white;
-                font-weight: bold;
-                padding: 6px 12px;
-                border-radius: 3px;
-                border: none;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #7d3c98;
-            }
-        """)
+        import_btn.setObjectName("importButton")
+        import_btn.setProperty("role", "managerAction")
         button_layout.addWidget(import_btn)
 
         button_layout.addStretch()
@@ -1234,20 +1553,8 @@ class ServerManagerDialog(QDialog):
         close_btn = QPushButton("Хаах")
         close_btn.clicked.connect(self._save_and_close)
         close_btn.setDefault(True)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #7f8c8d;
-                color: white;
-                font-weight: bold;
-                padding: 6px 16px;
-                border-radius: 3px;
-                border: none;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #616e70;
-            }
-        """)
+        close_btn.setObjectName("closeManagerButton")
+        close_btn.setProperty("role", "managerAction")
         button_layout.addWidget(close_btn)
 
         layout.addLayout(button_layout)
@@ -1255,36 +1562,11 @@ class ServerManagerDialog(QDialog):
     def _create_server_list_panel(self) -> QWidget:
         """Create server list panel"""
         panel = QGroupBox("Серверүүд")
-        panel.setStyleSheet("QGroupBox { font-weight: bold; font-size: 12px; } QGroupBox::title { color: #34495e; padding: 3px 0; }")
         layout = QVBoxLayout(panel)
 
         # Server list
         self.server_list = QListWidget()
         self.server_list.currentItemChanged.connect(self._on_server_selection_changed)
-        self.server_list.setStyleSheet("""
-            QListWidget {
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                padding: 4px;
-                background-color: #ecf0f1;
-                font-size: 11px;
-            }
-            QListWidget::item {
-                padding: 6px;
-                border-bottom: 1px solid #e0e0e0;
-            }
-            QListWidget::item:last {
-                border-bottom: none;
-            }
-            QListWidget::item:selected {
-                background-color: #3498db;
-                color: white;
-                border-radius: 2px;
-            }
-            QListWidget::item:hover {
-                background-color: #dfe6e9;
-            }
-        """)
         layout.addWidget(self.server_list)
 
         # List buttons
@@ -1293,66 +1575,22 @@ class ServerManagerDialog(QDialog):
 
         add_btn = QPushButton("➕ Нэмэх")
         add_btn.clicked.connect(self._add_server)
-        add_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                font-weight: bold;
-                padding: 6px 12px;
-                border-radius: 3px;
-                border: none;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #229a54;
-            }
-        """)
+        add_btn.setObjectName("addButton")
+        add_btn.setProperty("role", "managerAction")
         list_buttons.addWidget(add_btn)
 
         self.edit_btn = QPushButton("✏️ Засах")
         self.edit_btn.clicked.connect(self._edit_server)
         self.edit_btn.setEnabled(False)
-        self.edit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                font-weight: bold;
-                padding: 6px 12px;
-                border-radius: 3px;
-                border: none;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-        """)
+        self.edit_btn.setObjectName("editButton")
+        self.edit_btn.setProperty("role", "managerAction")
         list_buttons.addWidget(self.edit_btn)
 
         self.delete_btn = QPushButton("🗑️ Устгах")
         self.delete_btn.clicked.connect(self._delete_server)
         self.delete_btn.setEnabled(False)
-        self.delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                font-weight: bold;
-                padding: 6px 12px;
-                border-radius: 3px;
-                border: none;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-        """)
+        self.delete_btn.setObjectName("deleteButton")
+        self.delete_btn.setProperty("role", "managerAction")
         list_buttons.addWidget(self.delete_btn)
 
         layout.addLayout(list_buttons)
@@ -1362,7 +1600,6 @@ class ServerManagerDialog(QDialog):
     def _create_server_details_panel(self) -> QWidget:
         """Create server details panel"""
         panel = QGroupBox("Серверийн Дэлгэрэнгүй")
-        panel.setStyleSheet("QGroupBox { font-weight: bold; font-size: 12px; } QGroupBox::title { color: #34495e; padding: 3px 0; }")
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(12, 12, 12, 12)
 
@@ -1371,48 +1608,32 @@ class ServerManagerDialog(QDialog):
         form_layout.setVerticalSpacing(6)
 
         self.detail_name_label = QLabel("-")
-        self.detail_name_label.setStyleSheet("font-weight: bold; font-size: 14px; color: #2c3e50;")
+        self.detail_name_label.setObjectName("detailName")
         form_layout.addRow("Нэр:", self.detail_name_label)
 
         self.detail_host_label = QLabel("-")
-        self.detail_host_label.setStyleSheet("color: #34495e; font-size: 11px;")
+        self.detail_host_label.setProperty("role", "detail")
         form_layout.addRow("Хост:", self.detail_host_label)
 
         self.detail_ports_label = QLabel("-")
-        self.detail_ports_label.setStyleSheet("color: #34495e; font-size: 11px;")
+        self.detail_ports_label.setProperty("role", "detail")
         form_layout.addRow("Порт:", self.detail_ports_label)
 
         self.detail_ssl_label = QLabel("-")
-        self.detail_ssl_label.setStyleSheet("color: #34495e; font-size: 11px;")
+        self.detail_ssl_label.setProperty("role", "detail")
         form_layout.addRow("SSL:", self.detail_ssl_label)
 
         self.detail_auth_label = QLabel("-")
-        self.detail_auth_label.setStyleSheet("color: #34495e; font-size: 11px;")
+        self.detail_auth_label.setProperty("role", "detail")
         form_layout.addRow("Нэвтрэлт:", self.detail_auth_label)
 
         self.detail_rtmp_label = QLabel("-")
-        self.detail_rtmp_label.setStyleSheet("""
-            color: #2c3e50;
-            font-family: monospace;
-            font-size: 10px;
-            background-color: #ecf0f1;
-            padding: 4px;
-            border-radius: 3px;
-            border: 1px solid #ccc;
-        """)
+        self.detail_rtmp_label.setProperty("role", "detailUrl")
         self.detail_rtmp_label.setWordWrap(True)
         form_layout.addRow("RTMP URL:", self.detail_rtmp_label)
 
         self.detail_api_label = QLabel("-")
-        self.detail_api_label.setStyleSheet("""
-            color: #2c3e50;
-            font-family: monospace;
-            font-size: 10px;
-            background-color: #ecf0f1;
-            padding: 4px;
-            border-radius: 3px;
-            border: 1px solid #ccc;
-        """)
+        self.detail_api_label.setProperty("role", "detailUrl")
         self.detail_api_label.setWordWrap(True)
         form_layout.addRow("API URL:", self.detail_api_label)
 
@@ -1420,12 +1641,13 @@ class ServerManagerDialog(QDialog):
 
         # Description
         desc_group = QGroupBox("Тайлбар")
-        desc_group.setStyleSheet("QGroupBox { margin-top: 12px; font-weight: bold; font-size: 11px; } QGroupBox::title { color: #34495e; padding: 3px 0; }")
+        desc_group.setObjectName("descGroup")
         desc_layout = QVBoxLayout(desc_group)
 
         self.detail_description_label = QLabel("Тайлбар байхгүй")
+        self.detail_description_label.setObjectName("detailDescription")
+        self.detail_description_label.setProperty("empty", True)
         self.detail_description_label.setWordWrap(True)
-        self.detail_description_label.setStyleSheet("color: #555; font-style: italic; padding: 8px; background-color: #f9f9f9; border: 1px dashed #ddd; border-radius: 3px; font-size: 10px;")
         desc_layout.addWidget(self.detail_description_label)
 
         layout.addWidget(desc_group)
@@ -1437,47 +1659,15 @@ class ServerManagerDialog(QDialog):
         self.test_btn = QPushButton("🧪 Шалгах")
         self.test_btn.clicked.connect(self._test_selected_server)
         self.test_btn.setEnabled(False)
-        self.test_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                font-weight: bold;
-                padding: 6px 12px;
-                border-radius: 3px;
-                border: none;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-        """)
+        self.test_btn.setObjectName("testServerButton")
+        self.test_btn.setProperty("role", "managerAction")
         action_layout.addWidget(self.test_btn)
 
         self.copy_rtmp_btn = QPushButton("📋 RTMP URL Хуулах")
         self.copy_rtmp_btn.clicked.connect(self._copy_rtmp_url)
         self.copy_rtmp_btn.setEnabled(False)
-        self.copy_rtmp_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #95a5a6;
-                color: white;
-                font-weight: bold;
-                padding: 6px 12px;
-                border-radius: 3px;
-                border: none;
-                font-size: 10px;
-            }
-            QPushButton:hover {
-                background-color: #7f8c8d;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-        """)
+        self.copy_rtmp_btn.setObjectName("copyRtmpButton")
+        self.copy_rtmp_btn.setProperty("role", "managerAction")
         action_layout.addWidget(self.copy_rtmp_btn)
 
         layout.addLayout(action_layout)
@@ -1531,22 +1721,37 @@ class ServerManagerDialog(QDialog):
         self.servers.update(default_servers)
 
     def _populate_servers(self):
-        """Populate server list"""
-        self.server_list.clear()
-
-        for server_key, server_config in self.servers.items():
-            item = QListWidgetItem()
-            item.setData(Qt.ItemDataRole.UserRole, server_key)
-
-            if server_config.ssl_enabled:
-                item.setText(f"🔒 {server_config.name}")
-            else:
-                item.setText(f"🌐 {server_config.name}")
+        """Rebuild the whole server list (bulk changes only; single edits update items in place)"""
+        # One layout pass for the rebuild, and no currentItemChanged per removed/added item
+        self.server_list.setUpdatesEnabled(False)
+        self.server_list.blockSignals(True)
+        try:
+            # Refill the existing items in place; only grow or trim the tail
+            existing = self.server_list.count()
+            for row, (server_key, server_config) in enumerate(self.servers.items()):
+                if row < existing:
+                    self._set_item(self.server_list.item(row), server_key, server_config)
+                else:
+                    self._add_item(server_key, server_config)
+            for row in range(existing - 1, len(self.servers) - 1, -1):
+                self.server_list.takeItem(row)
+        finally:
+            self.server_list.blockSignals(False)
+            self.server_list.setUpdatesEnabled(True)
+        
+        self._on_server_selection_changed(self.server_list.currentItem(), None)
 
-            if server_config.description:
-                item.setToolTip(server_config.description)
+    def _set_item(self, item: QListWidgetItem, server_key: str, server_config: ServerConfig):
+        """Fill a list item from a server configuration"""
+        item.setData(Qt.ItemDataRole.UserRole, server_key)
+        item.setText(server_config.display_text)
+        item.setToolTip(server_config.description)
 
-            self.server_list.addItem(item)
+    def _add_item(self, server_key: str, server_config: ServerConfig):
+        """Append one server to the list"""
+        item = QListWidgetItem()
+        self._set_item(item, server_key, server_config)
+        self.server_list.addItem(item)
 
     def _on_server_selection_changed(self, current, previous):
         """Handle server selection change"""
@@ -1558,7 +1763,7 @@ class ServerManagerDialog(QDialog):
 
                 self.edit_btn.setEnabled(True)
                 self.delete_btn.setEnabled(True)
-                self.test_btn.setEnabled(True)
+                self.test_btn.setEnabled(not self._probe_running)
                 self.copy_rtmp_btn.setEnabled(True)
         else:
             self._clear_server_details()
@@ -1579,11 +1784,9 @@ class ServerManagerDialog(QDialog):
         self.detail_api_label.setText(server.api_url)
 
         if server.description:
-            self.detail_description_label.setText(server.description)
-            self.detail_description_label.setStyleSheet("color: #333; padding: 8px; background-color: #f9f9f9; border: 1px dashed #ddd; border-radius: 3px; font-size: 10px;")
+            self._set_description(server.description, empty=False)
         else:
-            self.detail_description_label.setText("Тайлбар байхгүй")
-            self.detail_description_label.setStyleSheet("color: #666; font-style: italic; padding: 8px; background-color: #f9f9f9; border: 1px dashed #ddd; border-radius: 3px; font-size: 10px;")
+            self._set_description("Тайлбар байхгүй", empty=True)
 
     def _clear_server_details(self):
         """Clear server details display"""
@@ -1591,8 +1794,28 @@ class ServerManagerDialog(QDialog):
                       self.detail_ssl_label, self.detail_auth_label, self.detail_rtmp_label, self.detail_api_label]:
             label.setText("-")
 
-        self.detail_description_label.setText("Сервер сонгогдоогүй байна")
-        self.detail_description_label.setStyleSheet("color: #666; font-style: italic; padding: 8px; background-color: #f9f9f9; border: 1px dashed #ddd; border-radius: 3px; font-size: 10px;")
+        self._set_description("Сервер сонгогдоогүй байна", empty=True)
+
+    def _set_description(self, text: str, empty: bool):
+        """Show description text; the placeholder look comes from the dialog QSS"""
+        label = self.detail_description_label
+        label.setText(text)
+        if label.property("empty") != empty:
+            label.setProperty("empty", empty)
+            # Dynamic property selectors only re-apply after a re-polish
+            label.style().unpolish(label)
+            label.style().polish(label)
+
+    def _unique_key(self, base: str) -> str:
+        """Return base, or base_N with the next free suffix when base is taken"""
+        if base not in self.servers:
+            return base
+        
+        counter = self._key_suffix.get(base, 1)
+        while f"{base}_{counter}" in self.servers:
+            counter += 1
+        self._key_suffix[base] = counter + 1
+        return f"{base}_{counter}"
 
     def _add_server(self):
         """Add new server"""
@@ -1600,17 +1823,12 @@ class ServerManagerDialog(QDialog):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             server_config = dialog.get_server_config()
             if server_config:
-                key = server_config.name.lower().replace(" ", "_").replace("-", "_")
-                counter = 1
-                original_key = key
-                while key in self.servers:
-                    key = f"{original_key}_{counter}"
-                    counter += 1
+                key = self._unique_key(server_config.name.lower().replace(" ", "_").replace("-", "_"))
 
                 try:
                     self.storage_manager.add_server(key, server_config)
                     self.servers[key] = server_config
-                    self._populate_servers()
+                    self._add_item(key, server_config)
                     
                     QMessageBox.information(self, "Амжилттай", f"Сервер '{server_config.name}' нэмэгдлээ")
                 except Exception as e:
@@ -1633,7 +1851,7 @@ class ServerManagerDialog(QDialog):
                 try:
                     self.storage_manager.update_server(server_key, server_config)
                     self.servers[server_key] = server_config
-                    self._populate_servers()
+                    self._set_item(current, server_key, server_config)
                     self._update_server_details(server_config)
                     
                     QMessageBox.information(self, "Амжилттай", f"Сервер '{server_config.name}' шинэчлэгдлээ")
@@ -1663,7 +1881,8 @@ class ServerManagerDialog(QDialog):
             try:
                 self.storage_manager.remove_server(server_key)
                 del self.servers[server_key]
-                self._populate_servers()
+                # Removing the current row moves the selection, which refreshes the details
+                self.server_list.takeItem(self.server_list.row(current))
                 
                 QMessageBox.information(self, "Амжилттай", f"Сервер '{server_name}' устгагдлаа")
             except Exception as e:
@@ -1677,28 +1896,42 @@ class ServerManagerDialog(QDialog):
             return
 
         server_key = current.data(Qt.ItemDataRole.UserRole)
-        if server_key in self.servers:
+        if server_key in self.servers and not self._probe_running:
             server = self.servers[server_key]
             
-            try:
-                import socket
-                
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(5)
-                result = sock.connect_ex((server.host, server.rtmp_port))
-                sock.close()
-                
-                if result == 0:
-                    QMessageBox.information(self, "Холболтын Тест", 
-                                          f"✅ '{server.name}' серверт амжилттай холбогдлоо!")
-                else:
-                    QMessageBox.warning(self, "Холболтын Тест", 
-                                      f"❌ '{server.name}' серверт холбогдож чадсангүй\n"
-                                      f"Хост: {server.host}:{server.rtmp_port}")
-                    
-            except Exception as e:
-                QMessageBox.warning(self, "Холболтын Тест", 
-                                  f"❌ Холболтын тест хийхэд алдаа гарлаа:\n{str(e)}")
+            # The connect can block for up to 5 seconds, so it runs on the thread pool
+            self._probe_running = True
+            self.test_btn.setEnabled(False)
+            QThreadPool.globalInstance().start(
+                lambda: self._probe_server(server.name, server.host, server.rtmp_port)
+            )
+
+    def _probe_server(self, name: str, host: str, port: int):
+        """Try a TCP connection to the server's RTMP port (runs on a pool thread)"""
+        # Always report back, otherwise the test button would stay disabled for good
+        success, message = False, ""
+        try:
+            with socket.create_connection((host, port), timeout=5):
+                pass
+            success, message = True, f"✅ '{name}' серверт амжилттай холбогдлоо!"
+        except socket.gaierror as e:
+            message = f"❌ Холболтын тест хийхэд алдаа гарлаа:\n{str(e)}"
+        except OSError:
+            message = f"❌ '{name}' серверт холбогдож чадсангүй\nХост: {host}:{port}"
+        except Exception as e:
+            message = f"❌ Холболтын тест хийхэд алдаа гарлаа:\n{str(e)}"
+        finally:
+            self._probe_finished.emit(success, message)
+
+    def _on_probe_done(self, success: bool, message: str):
+        """Show the connection test result back on the GUI thread"""
+        self._probe_running = False
+        self.test_btn.setEnabled(self.server_list.currentItem() is not None)
+        
+        if success:
+            QMessageBox.information(self, "Холболтын Тест", message)
+        else:
+            QMessageBox.warning(self, "Холболтын Тест", message)
 
     def _copy_rtmp_url(self):
         """Copy the RTMP URL of the selected server to clipboard"""
@@ -1710,13 +1943,12 @@ class ServerManagerDialog(QDialog):
         server_key = current.data(Qt.ItemDataRole.UserRole)
         if server_key in self.servers:
             server = self.servers[server_key]
-            clipboard = QApplication.clipboard()
-            clipboard.setText(server.rtmp_url)
+            self._clipboard.setText(server.rtmp_url)
             QToolTip.showText(
                 QCursor.pos(), 
-                f"RTMP URL амжилттай хуулагдлаа! 📋", 
+                "RTMP URL амжилттай хуулагдлаа! 📋", 
                 self.copy_rtmp_btn,
-                QRect(),
+                self._empty_rect,
                 3000
             )
         else:
@@ -1733,28 +1965,25 @@ class ServerManagerDialog(QDialog):
         
         if file_path:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _json_loads(Path(file_path).read_bytes())
                 
                 imported_count = 0
                 servers_data = data.get('servers', {})
                 
-                for server_id, server_info in servers_data.items():
-                    try:
-                        server_config = ServerConfig.from_dict(server_info)
-                        
-                        key = server_id
-                        counter = 1
-                        while key in self.servers:
-                            key = f"{server_id}_{counter}"
-                            counter += 1
-                        
-                        self.storage_manager.add_server(key, server_config)
-                        self.servers[key] = server_config
-                        imported_count += 1
-                        
-                    except Exception as e:
-                        self.logger.warning(f"Failed to import server {server_id}: {e}")
+                # One write and one servers_changed for the whole import
+                with self.storage_manager.batch():
+                    for server_id, server_info in servers_data.items():
+                        try:
+                            server_config = ServerConfig.from_dict(server_info)
+                            
+                            key = self._unique_key(server_id)
+                            
+                            self.storage_manager.add_server(key, server_config)
+                            self.servers[key] = server_config
+                            imported_count += 1
+                            
+                        except Exception as e:
+                            self.logger.warning(f"Failed to import server {server_id}: {e}")
                 
                 self._populate_servers()
                 QMessageBox.information(self, "Импорт", f"{imported_count} сервер амжилттай импорт хийгдлээ")
@@ -1786,8 +2015,8 @@ class ServerManagerDialog(QDialog):
                     "servers": servers_data
                 }
                 
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
+                # The export may be the user's only backup; never leave it half-written
+                _atomic_write(file_path, (_json_dumps(export_data),))
                 
                 QMessageBox.information(self, "Экспорт", f"Серверүүд амжилттай экспорт хийгдлээ:\n{file_path}")
                 
@@ -345,6 +345,9 @@ class ProfessionalStreamingStudio(QMainWindow):
         # UI state
         self.is_fullscreen = False
         self.normal_geometry = None
+        
+        # Server management dialog, built on first open and reused afterwards
+        self._server_dialog = None
 
         # Integration system components
         self.integration_system = None
@@ -1456,8 +1459,9 @@ class ProfessionalStreamingStudio(QMainWindow):
         """Open server management dialog"""
         if server_config_available:
             try:
-                dialog = ServerManagerDialog(self.config_manager, self)
-                dialog.exec()
+                if self._server_dialog is None:
+                    self._server_dialog = ServerManagerDialog(self.config_manager, self)
+                self._server_dialog.exec()
             except Exception as e:
                 self.logger.error(f"Failed to open server management: {e}")
                 self._show_status_message(f"Server management error: {e}")